@@ -0,0 +1,320 @@
+"""Offline benchmarks for the bot's hot paths, run against the fixtures in bench/fixtures.
+
+    python bench/run.py                          # Run everything, compare with bench/baseline.json
+    python bench/run.py --filter extract         # Only report benchmarks whose name contains "extract"
+    python bench/run.py --json results.json      # Also write the results as JSON
+    python bench/run.py --save-baseline          # Store this run as the new baseline
+
+Exits with 1 if a benchmark is slower than its baseline by more than --tolerance,
+or if an HTML backend disagrees with the bs4 reference on any fixture.
+"""
+import os
+import sys
+import json
+import glob
+import time
+import random
+import asyncio
+import argparse
+import platform
+import tempfile
+import statistics
+
+# Keep the bot's console quiet while benchmarking
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+os.environ.setdefault("TRACING", "false")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import main
+
+CATALOG_SIZES = (1_000, 10_000, 100_000)
+FEED_BATCH = 60             # Tools per feed poll, the size of one updateCache call in production
+TARGET_SECONDS = 0.2        # Time spent per repeat, the loop count is picked to fill it
+
+
+# ---------------- Fixtures ---------------- #
+def readFixture(*parts: str, binary: bool = False):
+    with open(os.path.join(FIXTURES, *parts), "rb" if binary else "r", encoding=None if binary else "utf-8") as f:
+        return f.read()
+
+def toolPages() -> dict[str, str]:
+    return {os.path.basename(path)[:-5]: readFixture("tools", os.path.basename(path)) for path in sorted(glob.glob(os.path.join(FIXTURES, "tools", "*.html")))}
+
+def syntheticTools(count: int, prefix: str = "tool") -> list[dict]:
+    """Catalog entries shaped like feed entries, with feed-length summaries"""
+    rng = random.Random(count)
+    words = "fast terminal cli tool search fuzzy git json viewer monitor process network shell prompt editor".split()
+    return [{
+        "title": f"{prefix}-{i}",
+        "summary": " ".join(rng.choice(words) for _ in range(rng.randint(8, 30))),
+        "link": f"https://terminaltrove.com/{prefix}-{i}/",
+    } for i in range(count)]
+
+
+# ---------------- Timing ---------------- #
+def measure(func, repeats: int) -> dict:
+    """Per-call timings: the loop count is calibrated so each repeat takes about TARGET_SECONDS"""
+    func()  # Warm up
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= TARGET_SECONDS / 4 or loops >= 1 << 20:
+            break
+        loops *= 2
+    loops = max(1, int(loops * TARGET_SECONDS / max(elapsed, 1e-9)))
+
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "stdev_ms": (statistics.stdev(samples) if len(samples) > 1 else 0.0) * 1000,
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+def measureOnce(setup, func, repeats: int) -> dict:
+    """For work that changes state (cache inserts): fresh setup() before every timed call"""
+    samples = []
+    for _ in range(repeats + 1):
+        state = setup()
+        started = time.perf_counter()
+        func(state)
+        samples.append(time.perf_counter() - started)
+    samples = samples[1:]   # First call warms up
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "stdev_ms": (statistics.stdev(samples) if len(samples) > 1 else 0.0) * 1000,
+        "loops": 1,
+        "repeats": repeats,
+    }
+
+
+# ---------------- Benchmarks ---------------- #
+def benchFeed(repeats: int) -> dict:
+    content = readFixture("new.xml", binary=True)
+    entries = len(list(main.iterFeedEntries(content)))
+    first = next(main.iterFeedEntries(content))
+
+    async def since():
+        main.lastToolCache.update(content=None, tools=None)
+        return await main.getNewToolsSince(lambda tool: tool['title'] == first['title'])
+
+    async def fetchFeed():
+        return content
+
+    loop = asyncio.new_event_loop()
+    original = main.fetchFeed
+    main.fetchFeed = fetchFeed
+    try:
+        return {
+            f"feed_parse_{entries}": measure(lambda: list(main.iterFeedEntries(content)), repeats),
+            # A poll with nothing new stops after the first entry
+            "feed_since_unchanged": measure(lambda: loop.run_until_complete(since()), repeats),
+        }
+    finally:
+        main.fetchFeed = original
+        loop.close()
+
+def checkParity() -> list[str]:
+    """Every HTML backend must extract the same parts as the bs4 reference, for each set of targets the scrapers ask for"""
+    pages = dict(toolPages(), totw=readFixture("totw.html"))
+    failures = []
+    for name, html in pages.items():
+        for targets in (main.PAGE_PARTS, main.SEARCH_PARTS, main.TOTW_PARTS):
+            for mismatch in main.backendMismatches(html, targets):
+                failures.append(f"{mismatch} on {name} ({', '.join(targets)})")
+    return failures
+
+def benchExtract(repeats: int) -> dict:
+    pages = list(toolPages().values())
+    totwPage = readFixture("totw.html")
+    results = {}
+    for backend in main.HTML_BACKENDS:
+        # Same targets as fetchSearch and fetchToolOfTheWeek
+        results[f"extract_tool_page[{backend}]"] = measure(lambda: [main.extractPage(html, main.SEARCH_PARTS, backend) for html in pages], repeats)
+        results[f"extract_tool_page[{backend}]"]["pages"] = len(pages)
+        results[f"extract_totw[{backend}]"] = measure(lambda: main.extractPage(totwPage, main.TOTW_PARTS, backend), repeats)
+    return results
+
+def benchUpdateCache(repeats: int, sizes=CATALOG_SIZES) -> dict:
+    """updateCache with the JSON catalog and fresh search indexes. Disk writes are debounced off the loop, timed separately"""
+    results = {}
+    directory = tempfile.mkdtemp(prefix="trove-bench-")
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    originals = (main.toolCatalog, main.searchIndex, main.prefixIndex)
+
+    def freshCatalog(tools: list[dict] = ()) -> main.ToolCatalog:
+        catalog = main.ToolCatalog(path=os.path.join(directory, "tool_cache.json"), flushDelay=3600)
+        main.toolCatalog, main.searchIndex, main.prefixIndex = catalog, main.FuzzyIndex(), main.PrefixIndex()
+        # Filled the way load() does, so setup doesn't write the file
+        for tool in tools:
+            catalog.titles.add(tool['title'])
+            catalog.tools.append(dict(tool))
+            catalog.indexTool(catalog.tools[-1])
+        main.buildSearchIndex()
+        return catalog
+
+    async def run(call):
+        result = call()
+        # Drop the debounced write so it doesn't pile up between runs
+        if main.toolCatalog.flushTask is not None:
+            main.toolCatalog.flushTask.cancel()
+        main.toolCatalog.dirty = False
+        return result
+
+    try:
+        for size in sizes:
+            tools = syntheticTools(size)
+            fresh = syntheticTools(FEED_BATCH, prefix="new")
+            runs = max(1, repeats if size < 100_000 else repeats // 2)
+
+            # Cold start: the whole catalog arrives in one call
+            results[f"update_cache_insert_{size}"] = measureOnce(
+                lambda: (freshCatalog(), [dict(tool) for tool in tools])[1],
+                lambda batch: loop.run_until_complete(run(lambda: main.updateCache(batch))),
+                runs)
+
+            # Steady state: a feed poll of tools that are all cached already
+            freshCatalog(tools)
+            known = [dict(tool) for tool in tools[-FEED_BATCH:]]
+            results[f"update_cache_known_{size}"] = measure(lambda: loop.run_until_complete(run(lambda: main.updateCache(known))), repeats)
+
+            # A feed poll with a full batch of new tools on top of the catalog
+            results[f"update_cache_new_batch_{size}"] = measureOnce(
+                lambda: (freshCatalog(tools), [dict(tool) for tool in fresh])[1],
+                lambda batch: loop.run_until_complete(run(lambda: main.updateCache(batch))),
+                runs)
+
+            # The debounced background write of the whole catalog
+            catalog = freshCatalog(tools)
+            results[f"catalog_write_{size}"] = measureOnce(lambda: None, lambda _: catalog.writeFile([dict(tool) for tool in catalog.tools]), runs)
+    finally:
+        main.toolCatalog, main.searchIndex, main.prefixIndex = originals
+        asyncio.set_event_loop(None)
+        loop.close()
+        for path in glob.glob(os.path.join(directory, "*")) + glob.glob(os.path.join(directory, ".*")):
+            os.remove(path)
+        os.rmdir(directory)
+    return results
+
+def benchRender(repeats: int) -> dict:
+    """The first createEmbed() renders and packs every page, later page turns reuse them"""
+    feedTools = list(main.iterFeedEntries(readFixture("new.xml", binary=True)))
+    largeList = syntheticTools(1_000)
+
+    def render(data):
+        return main.CreateEmbed(data=data, **main.PAGE_LAYOUTS["tools"]).createEmbed()
+
+    def pageTurns(view):
+        for page in range(view.end + 1):
+            view.currentPage = page
+            view.createEmbed()
+
+    warmView = main.CreateEmbed(data=feedTools, **main.PAGE_LAYOUTS["tools"])
+    warmView.createEmbed()
+    return {
+        f"render_pages_{len(feedTools)}": measure(lambda: render(feedTools), repeats),
+        f"render_pages_{len(largeList)}": measure(lambda: render(largeList), repeats),
+        f"page_turns_{len(feedTools)}": measure(lambda: pageTurns(warmView), repeats),
+    }
+
+BENCHMARKS = {
+    "feed": benchFeed,
+    "extract": benchExtract,
+    "update_cache": benchUpdateCache,
+    "render": benchRender,
+}
+
+
+# ---------------- Baseline ---------------- #
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Benchmarks slower than the baseline allows. Best times are compared, they are the least sensitive to machine noise"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        if result["min_ms"] > previous["min_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: {result['min_ms']:.3f} ms vs baseline {previous['min_ms']:.3f} ms (+{(result['min_ms'] / previous['min_ms'] - 1) * 100:.0f}%)")
+    return regressions
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "htmlBackends": sorted(main.HTML_BACKENDS),
+    }
+
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the Terminal Trove bot")
+    parser.add_argument("--filter", default="", help="Only report benchmarks whose name contains this")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed repeats per benchmark (median is reported)")
+    parser.add_argument("--quick", action="store_true", help="Fewer repeats and no 100k catalog, for a fast sanity run")
+    parser.add_argument("--json", metavar="PATH", help="Write the results to this file")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE_FILE, help="Baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a benchmark counts as a regression (0.25 = 25%%)")
+    return parser.parse_args()
+
+def runBenchmarks() -> int:
+    args = parseArgs()
+    repeats = 3 if args.quick else args.repeats
+
+    failures = checkParity()
+    for failure in failures:
+        print(f"PARITY  {failure}")
+
+    results = {}
+    for group, bench in BENCHMARKS.items():
+        if args.quick and group == "update_cache":
+            groupResults = bench(repeats, sizes=CATALOG_SIZES[:2])
+        else:
+            groupResults = bench(repeats)
+        for name, result in groupResults.items():
+            if args.filter in name:
+                results[name] = result
+                print(f"{name:<36} {result['median_ms']:>12.4f} ms  (min {result['min_ms']:.4f}, stdev {result['stdev_ms']:.4f})")
+
+    report = {"environment": environment(), "results": results, "parity": failures}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 1 if failures else 0
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("environment", {}).get("python") != platform.python_version():
+            print(f"Note: baseline was recorded on Python {baseline.get('environment', {}).get('python')}, numbers may not compare")
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"SLOWER  {regression}")
+        if not regressions:
+            print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 1 if failures or regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(runBenchmarks())
@@ -1,35 +1,43 @@
 import os
+import io
+import asyncio
+import aiohttp
+from aiohttp import web
 import discord                 
 from discord.ext import commands ,tasks  
 from dotenv import load_dotenv
 import xml.etree.ElementTree as ET 
-import requests
 from datetime import time                
 import datetime         
 import json
+import hashlib
 import random
+import bisect
+import sqlite3
+import time as clock
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import tempfile
+import logging
+import logging.handlers
+import queue
+import sys
+import atexit
+import contextlib
+import contextvars
+import functools
+import math
+import multiprocessing
 from colorama import init, Fore
 from zoneinfo import ZoneInfo
 from bs4 import BeautifulSoup
+from html.parser import HTMLParser
 
-# ---------------- Logging ---------------- # 
-# SHOUTOUT EIGHTBY8
-def log(message: str, level: str = "INFO") -> None:
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %I:%M:%S %p")
-    colors = {
-        "INFO": Fore.CYAN,
-        "SUCCESS": Fore.GREEN,
-        "WARNING": Fore.YELLOW,
-        "ERROR": Fore.RED,
-        "RANDOM TOOL": Fore.MAGENTA,
-        "SEARCH TOOL": Fore.MAGENTA,
-        "NEW TOOL": Fore.MAGENTA,
-        "TOTW": Fore.MAGENTA,
-        "SEARCH": Fore.MAGENTA
-    }
-    color = colors.get(level, "")
-    print(color + f"[{timestamp}] [{level}] {message}")
-
+try:
+    import lxml.html as lxmlHtml
+except ImportError:
+    lxmlHtml = None
 
 # Initalize colorama
 init(autoreset=True)
@@ -38,6 +46,327 @@ init(autoreset=True)
 load_dotenv()
 
 
+# ---------------- Logging ---------------- # 
+# SHOUTOUT EIGHTBY8
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()              # "text" (colored) or "json" (one object per line)
+LOG_SAMPLE_INTERVAL = float(os.getenv("LOG_SAMPLE_INTERVAL", 10))  # Seconds between sampled events of the same kind
+LOG_COLORS = {
+    "INFO": Fore.CYAN,
+    "SUCCESS": Fore.GREEN,
+    "WARNING": Fore.YELLOW,
+    "ERROR": Fore.RED,
+    "RANDOM TOOL": Fore.MAGENTA,
+    "SEARCH TOOL": Fore.MAGENTA,
+    "NEW TOOL": Fore.MAGENTA,
+    "TOTW": Fore.MAGENTA,
+    "SEARCH": Fore.MAGENTA
+}
+LOG_LEVELS = {"DEBUG": logging.DEBUG, "WARNING": logging.WARNING, "ERROR": logging.ERROR}  # Every other tag is INFO
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %I:%M:%S %p")
+        fields = "".join(f" {key}={value}" for key, value in record.fields.items())
+        return LOG_COLORS.get(record.tag, "") + f"[{timestamp}] [{record.tag}] {record.getMessage()}{fields}"
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.tag,
+            "message": record.getMessage(),
+        }
+        entry.update(record.fields)
+        return json.dumps(entry, default=str)
+
+class LogSampler:
+    """Lets one event per key through every interval and counts the rest"""
+    def __init__(self, interval: float = LOG_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.last: dict[str, float] = {}
+        self.dropped: Counter = Counter()
+
+    def allow(self, key: str) -> int | None:
+        """None if the event should be dropped, else how many were dropped since the last one"""
+        now = clock.monotonic()
+        if now - self.last.get(key, -self.interval) < self.interval:
+            self.dropped[key] += 1
+            return None
+        self.last[key] = now
+        return self.dropped.pop(key, 0)
+
+logger = logging.getLogger("trove")
+logger.setLevel(LOG_LEVEL)
+logger.propagate = False
+logSampler = LogSampler()
+
+# The event loop only enqueues records, a listener thread formats and writes them
+logQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(logQueue))
+logOutput = logging.StreamHandler(sys.stdout)
+logOutput.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+logListener = logging.handlers.QueueListener(logQueue, logOutput)
+logListener.start()
+atexit.register(logListener.stop)
+
+def log(message: str, level: str = "INFO", sample: str | None = None, **fields) -> None:
+    """Log a message under a tag. Extra keyword arguments become structured fields.
+    Events sharing a sample key are rate-limited to one per LOG_SAMPLE_INTERVAL"""
+    severity = LOG_LEVELS.get(level, logging.INFO)
+    if not logger.isEnabledFor(severity):
+        return
+    if sample is not None:
+        dropped = logSampler.allow(sample)
+        if dropped is None:
+            return
+        if dropped:
+            fields["sampledOut"] = dropped
+    logger.log(severity, message, extra={"tag": level, "fields": fields})
+
+
+# ---------------- Metrics ---------------- #
+METRICS_PORT = int(os.getenv("METRICS_PORT", 0))          # 0 keeps the /metrics endpoint off
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # Seconds
+
+class Histogram:
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)      # Last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+def metricName(key: str) -> str:
+    """camelCase stats keys to Prometheus snake_case"""
+    return "".join(f"_{char.lower()}" if char.isupper() else char for char in key)
+
+def metricLabels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+class Metrics:
+    """Counters, latency histograms and collected stats(), rendered in the Prometheus text format"""
+    def __init__(self, prefix: str = "trove"):
+        self.prefix = prefix
+        self.help: dict[str, str] = {}
+        self.counters: dict[str, dict[tuple, float]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+        self.collectors: dict[str, tuple] = {}   # name -> (stats, keys that only ever grow)
+
+    def describe(self, name: str, text: str) -> None:
+        self.help[name] = text
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(seconds)
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels):
+        started = clock.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, clock.perf_counter() - started, **labels)
+
+    def collect(self, name: str, stats, counters=()) -> None:
+        """Export every number stats() returns as <name>_<key>. Keys in counters are monotonic and become <name>_<key>_total counters, the rest are gauges"""
+        self.collectors[name] = (stats, frozenset(counters))
+
+    def render(self) -> str:
+        lines = []
+        def header(name: str, kind: str) -> str:
+            fullName = f"{self.prefix}_{name}"
+            if name in self.help:
+                lines.append(f"# HELP {fullName} {self.help[name]}")
+            lines.append(f"# TYPE {fullName} {kind}")
+            return fullName
+
+        for name, series in sorted(self.counters.items()):
+            fullName = header(name, "counter")
+            for labels, value in series.items():
+                lines.append(f"{fullName}{metricLabels(labels)} {value}")
+
+        for name, series in sorted(self.histograms.items()):
+            fullName = header(name, "histogram")
+            for labels, histogram in series.items():
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (math.inf,), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else bound
+                    lines.append(f"{fullName}_bucket{metricLabels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{fullName}_sum{metricLabels(labels)} {histogram.total}")
+                lines.append(f"{fullName}_count{metricLabels(labels)} {histogram.count}")
+
+        for name, (stats, counters) in sorted(self.collectors.items()):
+            try:
+                values = stats()
+            except Exception as e:
+                log(f"Metrics collector '{name}' failed: {e}", "ERROR")
+                continue
+            for key, value in values.items():
+                if isinstance(value, (int, float)):
+                    kind = "counter" if key in counters else "gauge"
+                    fullName = f"{self.prefix}_{name}_{metricName(key)}" + ("_total" if kind == "counter" else "")
+                    lines.append(f"# TYPE {fullName} {kind}")
+                    lines.append(f"{fullName} {float(value)}")
+        return "\n".join(lines) + "\n"
+
+metrics = Metrics()
+metrics.describe("commands_total", "Slash commands handled, by outcome")
+metrics.describe("command_seconds", "Slash command latency from invocation to return")
+metrics.describe("upstream_requests_total", "Requests to terminaltrove.com, by target and status")
+metrics.describe("upstream_seconds", "Terminal Trove request latency")
+metrics.describe("parse_seconds", "Tool page extraction time")
+metrics.describe("update_cache_seconds", "Time to merge tools into the catalog")
+metrics.describe("catalog_tools_added_total", "Tools newly added to the catalog")
+metrics.describe("catalog_lookups_total", "/searchtool answers found in the local catalog")
+metrics.describe("feed_polls_total", "websiteUpdate runs, by outcome")
+metrics.describe("feed_poll_seconds", "websiteUpdate run time")
+
+class MetricsServer:
+    """Optional local /metrics endpoint for Prometheus to scrape"""
+    def __init__(self, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        self.host = host
+        self.port = port
+        self.runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        if not self.port or self.runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        try:
+            await web.TCPSite(self.runner, self.host, self.port).start()
+        except OSError as e:
+            log(f"Metrics endpoint could not start on {self.host}:{self.port}: {e}", "ERROR")
+            await self.stop()
+            return
+        log(f"Metrics served on http://{self.host}:{self.port}/metrics", "INFO")
+
+    async def handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=metrics.render().encode(), headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+    async def stop(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+metricsServer = MetricsServer()
+
+
+# ---------------- Tracing ---------------- #
+TRACING = os.getenv("TRACING", "true").lower() != "false"
+TRACE_BUFFER = int(os.getenv("TRACE_BUFFER", 500))       # Most recent command traces kept for /stats
+TRACE_STAGES = ("defer", "http", "parse", "cache", "embed", "send")
+
+class Trace:
+    """Stage timings of one command run"""
+    __slots__ = ("command", "total", "spans")
+
+    def __init__(self, command: str):
+        self.command = command
+        self.total = 0.0
+        self.spans: list[tuple[str, float]] = []
+
+    def stages(self) -> dict[str, float]:
+        totals = {}
+        for stage, seconds in self.spans:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+class Span:
+    __slots__ = ("trace", "stage", "started")
+
+    def __init__(self, trace: Trace, stage: str):
+        self.trace = trace
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = clock.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.trace.spans.append((self.stage, clock.perf_counter() - self.started))
+        return False
+
+NO_SPAN = contextlib.nullcontext()
+currentTrace: contextvars.ContextVar[Trace | None] = contextvars.ContextVar("currentTrace", default=None)
+
+def span(stage: str):
+    """Time a stage of the running command. A shared no-op outside a trace or with tracing off"""
+    trace = currentTrace.get()
+    return NO_SPAN if trace is None else Span(trace, stage)
+
+def percentiles(values: list[float]) -> tuple[float, float, float]:
+    """Nearest-rank p50/p95/p99"""
+    ordered = sorted(values)
+    return tuple(ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)] for q in (0.5, 0.95, 0.99))
+
+class Tracer:
+    """Ring buffer of recent command traces"""
+    def __init__(self, size: int = TRACE_BUFFER, enabled: bool = TRACING):
+        self.enabled = enabled
+        self.traces: deque[Trace] = deque(maxlen=size)
+
+    @contextlib.contextmanager
+    def trace(self, command: str):
+        if not self.enabled:
+            yield None
+            return
+        trace = Trace(command)
+        token = currentTrace.set(trace)
+        started = clock.perf_counter()
+        try:
+            yield trace
+        finally:
+            trace.total = clock.perf_counter() - started
+            currentTrace.reset(token)
+            self.traces.append(trace)
+
+    def summary(self) -> dict[str, dict]:
+        """Per command: run count, total p50/p95/p99 and the same per stage"""
+        byCommand: dict[str, list[Trace]] = {}
+        for trace in self.traces:
+            byCommand.setdefault(trace.command, []).append(trace)
+
+        summary = {}
+        for command, traces in sorted(byCommand.items()):
+            stageTimes: dict[str, list[float]] = {}
+            for trace in traces:
+                for stage, seconds in trace.stages().items():
+                    stageTimes.setdefault(stage, []).append(seconds)
+            summary[command] = {
+                "count": len(traces),
+                "total": percentiles([trace.total for trace in traces]),
+                "stages": {stage: percentiles(stageTimes[stage]) for stage in TRACE_STAGES if stage in stageTimes},
+            }
+        return summary
+
+tracer = Tracer()
+
+
 # ---------------- Globals ---------------- #
 TOKEN = os.getenv("DISCORD_TOKEN")
 LAST_POSTED_TITLE = ""
@@ -54,7 +383,8 @@ else:
 
 
 # ---------------- Cache ---------------- #
-lastToolCache = {} # Stores tools for commands
+# Stores the last 'new.xml' validators, raw body and parsed tools for conditional GETs
+lastToolCache = {"etag": None, "lastModified": None, "content": None, "tools": None, "snapshot": None}
 
 
 # ---------------- Defaults ---------------- #
@@ -69,19 +399,943 @@ guild_configs: dict[int, dict[str, int | None]] = {}
 # Eastern Timezone
 EASTERN = ZoneInfo("America/New_York")
 
+# ---------------- HTTP Client ---------------- #
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))                 # Seconds per request (connect + read)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 10))   # Keep-alive pool size
+HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", 4))    # Requests in flight at once
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+class HttpResponse:
+    """Fully read upstream response, detached from its pooled connection"""
+    def __init__(self, status: int, content: bytes, headers, charset: str | None = None):
+        self.status = status
+        self.content = content
+        self.headers = headers
+        self.charset = charset or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.charset, errors="replace")
+
+def upstreamTarget(url: str) -> str:
+    """Low-cardinality metrics label for a Terminal Trove URL"""
+    path = url.split("://", 1)[-1].partition("/")[2].strip("/")
+    if path == "new.xml":
+        return "feed"
+    if path == "tool-of-the-week":
+        return "totw"
+    return "tool"
+
+class HttpClient:
+    """Shared aiohttp session with a keep-alive pool, timeouts and a concurrency cap"""
+    def __init__(self, timeout: float = HTTP_TIMEOUT, maxConnections: int = HTTP_MAX_CONNECTIONS, maxConcurrency: int = HTTP_MAX_CONCURRENCY):
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.maxConnections = maxConnections
+        self.semaphore = asyncio.Semaphore(maxConcurrency)
+        self.session: aiohttp.ClientSession | None = None
+
+    def getSession(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the bot's running loop
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.maxConnections, keepalive_timeout=60, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout, headers=HTTP_HEADERS)
+        return self.session
+
+    async def get(self, url: str, headers: dict | None = None) -> HttpResponse | None:
+        """GET a URL without blocking the event loop. Returns None on network errors/timeouts"""
+        target = upstreamTarget(url)
+        with span("http"):
+            async with self.semaphore:
+                started = clock.perf_counter()
+                try:
+                    async with self.getSession().get(url, headers=headers) as response:
+                        content = await response.read()
+                        metrics.inc("upstream_requests_total", target=target, status=response.status)
+                        return HttpResponse(response.status, content, response.headers, response.charset)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    metrics.inc("upstream_requests_total", target=target, status="error")
+                    log(f"HTTP request failed for <{url}>: {e!r}", "ERROR")
+                    return None
+                finally:
+                    metrics.observe("upstream_seconds", clock.perf_counter() - started, target=target)
+
+    async def close(self) -> None:
+        if self.session and not self.session.closed:
+            await self.session.close()
+            log("HTTP session closed", "INFO")
+
+httpClient = HttpClient()
+
+class SingleFlight:
+    """Concurrent callers asking for the same key await one shared in-flight call"""
+    def __init__(self):
+        self.calls: dict[str, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: str, factory):
+        task = self.calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self.calls[key] = task
+            task.add_done_callback(lambda done: self.forget(key, done))
+        else:
+            self.shared += 1
+        # Shielded so one caller timing out doesn't cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    def forget(self, key: str, task: asyncio.Future) -> None:
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved even if every waiter went away
+
+inFlight = SingleFlight()
+metrics.collect("single_flight", lambda: {"shared": inFlight.shared, "inFlight": len(inFlight.calls)}, counters=("shared",))
+
+
+# ---------------- Tool Catalog ---------------- #
+CACHE_FILE = "tool_cache.json"
+CACHE_DB = "tool_cache.db"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "json").lower()   # "json" or "sqlite"
+CACHE_FLUSH_DELAY = float(os.getenv("CACHE_FLUSH_DELAY", 5))  # Seconds to coalesce writes
+
+def normalizeTitle(title: str) -> str:
+    return " ".join(title.lower().split())
+
+def slugify(query: str) -> str:
+    """Turn a tool name into its Terminal Trove URL slug"""
+    return query.lower().replace(" ", "-").strip("/")
+
+def writeAtomic(path: str, write, mode: str = "w") -> None:
+    """Replace a file in one step (temp file + fsync + rename). write(f) fills the temp file. Blocking, run it in a thread"""
+    directory = os.path.dirname(os.path.abspath(path))
+    prefix = f".{os.path.splitext(os.path.basename(path))[0]}."
+    with tempfile.NamedTemporaryFile(mode, dir=directory, prefix=prefix, suffix=".tmp", delete=False) as f:
+        try:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+def toolSlug(tool: dict) -> str:
+    """Slug from the tool's link, falling back to its title"""
+    link = tool.get('link') or ""
+    slug = link.rstrip("/").rsplit("/", 1)[-1] if link else ""
+    return slug.lower() or slugify(normalizeTitle(tool['title']))
+
+class ToolCatalog:
+    """In-memory tool list shared by every command, written to disk by a debounced background writer"""
+    def __init__(self, path: str = CACHE_FILE, flushDelay: float = CACHE_FLUSH_DELAY):
+        self.path = path
+        self.flushDelay = flushDelay
+        self.tools: list[dict] = []
+        self.titles: set[str] = set()
+        self.index: dict[str, dict] = {}  # Normalized title / slug / link -> tool
+        self.dirty = False
+        self.flushTask: asyncio.Task | None = None
+        self.writing = False   # flushTask is past its debounce and inside writeFile
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def __iter__(self):
+        return iter(self.tools)
+
+    def load(self) -> None:
+        """Read the JSON cache once at startup"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = []
+        self.tools = data
+        self.titles = {tool['title'] for tool in data}
+        self.index = {}
+        for tool in data:
+            self.indexTool(tool)
+        log(f"Tool cache loaded: {len(self.tools)} tools from {self.path}", "INFO")
+
+    def indexTool(self, tool: dict) -> None:
+        # First entry wins, matching the title dedupe in add()
+        self.index.setdefault(normalizeTitle(tool['title']), tool)
+        self.index.setdefault(toolSlug(tool), tool)
+        if tool.get('link'):
+            self.index.setdefault(tool['link'], tool)
+
+    def lookup(self, query: str) -> dict | None:
+        """Find a tool by title, slug or link"""
+        return self.index.get(normalizeTitle(query)) or self.index.get(slugify(query)) or self.index.get(query)
+
+    def at(self, position: int) -> dict:
+        return self.tools[position]
+
+    def pick(self) -> dict:
+        return random.choice(self.tools)
+
+    def update(self, title: str, fields: dict) -> None:
+        """Merge fields into a cached tool and schedule a write"""
+        tool = self.index.get(normalizeTitle(title))
+        if tool is not None:
+            tool.update(fields)
+            self.markDirty()
+
+    def add(self, newData) -> list[dict]:
+        """Append tools we haven't seen before and return the ones that were added"""
+        added = []
+        for tool in newData:
+            if tool['title'] not in self.titles:
+                self.titles.add(tool['title'])
+                self.tools.append(tool)
+                self.indexTool(tool)
+                added.append(tool)
+        if added:
+            self.markDirty()
+        return added
+
+    async def snapshot(self) -> list[dict]:
+        """Every tool. Nothing to read, the list is already in memory"""
+        return list(self.tools)
+
+    def markDirty(self) -> None:
+        self.dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup/scripts): write straight away
+            self.flush()
+            return
+        if self.flushTask is None or self.flushTask.done():
+            self.flushTask = loop.create_task(self.flushLater())
+
+    async def flushLater(self) -> None:
+        # Every update inside the delay window lands in a single write
+        await asyncio.sleep(self.flushDelay)
+        while self.dirty:
+            self.dirty = False
+            snapshot = [dict(tool) for tool in self.tools]
+            self.writing = True
+            try:
+                await asyncio.to_thread(self.writeFile, snapshot)
+            except OSError as e:
+                self.dirty = True
+                log(f"Failed to write {self.path}: {e}", "ERROR")
+                return
+            finally:
+                self.writing = False
+
+    def writeFile(self, snapshot: list[dict]) -> None:
+        """Atomically replace the cache file"""
+        writeAtomic(self.path, lambda f: json.dump(snapshot, f, indent=4))
+
+    def flush(self) -> None:
+        if self.dirty:
+            self.dirty = False
+            self.writeFile([dict(tool) for tool in self.tools])
+
+    async def close(self) -> None:
+        """Cancel a pending debounce, let a running write finish, then write any remaining changes"""
+        if self.flushTask and not self.flushTask.done():
+            if self.writing:
+                # Cancelling wouldn't stop the thread, and a second writer could replace the file with older data
+                await self.flushTask
+            else:
+                self.flushTask.cancel()
+        if self.dirty:
+            self.dirty = False
+            await asyncio.to_thread(self.writeFile, [dict(tool) for tool in self.tools])
+            log(f"Tool cache flushed to {self.path}", "INFO")
+
+class SqliteToolCatalog:
+    """SQLite (WAL) catalog with indexed lookups and incremental inserts. Same interface as ToolCatalog.
+    Writes and full scans run in a worker thread on their own connection, in the order they were made.
+    Point reads (lookup/at) stay on the loop: they are single indexed rows, and tools still waiting
+    to be written are served from memory"""
+    def __init__(self, path: str = CACHE_DB, jsonPath: str = CACHE_FILE):
+        self.path = path
+        self.jsonPath = jsonPath
+        self.conn: sqlite3.Connection | None = None      # Reads, event loop thread only
+        self.writer: sqlite3.Connection | None = None    # Writes and scans, one worker thread at a time
+        self.titles: set[str] = set()
+        self.stored = 0                                  # Rows committed, ids 1..stored
+        self.pending: list[dict] = []                    # Added tools not written yet, in id order
+        self.ops: list = []
+        self.writeTask: asyncio.Task | None = None
+        self.writeLock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return self.stored + len(self.pending)
+
+    def __iter__(self):
+        # Startup only (search index build), use snapshot() once the bot is running
+        for (data,) in self.conn.execute("SELECT data FROM tools ORDER BY id"):
+            yield json.loads(data)
+        yield from self.pending
+
+    def load(self) -> None:
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS tools (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL UNIQUE,
+                    norm_title TEXT NOT NULL,
+                    slug TEXT NOT NULL,
+                    link TEXT,
+                    data TEXT NOT NULL
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tools_norm_title ON tools(norm_title)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tools_slug ON tools(slug)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tools_link ON tools(link)")
+        self.titles = {title for (title,) in self.conn.execute("SELECT title FROM tools")}
+        self.stored = len(self.titles)
+        self.writer = sqlite3.connect(self.path, check_same_thread=False)
+        self.writer.execute("PRAGMA synchronous=NORMAL")
+
+        if self.stored == 0 and os.path.exists(self.jsonPath):
+            migrateJsonToSqlite(self.jsonPath, self)
+        log(f"Tool cache loaded: {len(self)} tools from {self.path}", "INFO")
+
+    def add(self, newData) -> list[dict]:
+        """New titles are decided in memory, the inserts are queued for the writer thread"""
+        added = []
+        for tool in newData:
+            if tool['title'] not in self.titles:
+                self.titles.add(tool['title'])
+                self.pending.append(tool)
+                added.append(tool)
+        if added:
+            # Serialized now, the dicts may change on the loop while the writer runs
+            rows = [(tool['title'], normalizeTitle(tool['title']), toolSlug(tool), tool.get('link'), json.dumps(tool)) for tool in added]
+            self.queue(self.insertRows, rows)
+        return added
+
+    def insertRows(self, rows: list[tuple]) -> None:
+        self.writer.executemany("INSERT OR IGNORE INTO tools (title, norm_title, slug, link, data) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def committed(self, ops: list) -> None:
+        # Runs on the loop once a batch is on disk: written tools are read back from SQLite from now on
+        written = {row[0] for op, args in ops if op == self.insertRows for row in args[0]}
+        if written:
+            self.stored += len(written)
+            self.pending = [tool for tool in self.pending if tool['title'] not in written]
+
+    def lookup(self, query: str) -> dict | None:
+        row = self.conn.execute(
+            "SELECT data FROM tools WHERE norm_title = ? OR slug = ? OR link = ? ORDER BY id LIMIT 1",
+            (normalizeTitle(query), slugify(query), query),
+        ).fetchone()
+        if row:
+            return json.loads(row[0])
+        return next((tool for tool in self.pending if query in (tool['title'], tool.get('link')) or normalizeTitle(tool['title']) == normalizeTitle(query) or toolSlug(tool) == slugify(query)), None)
+
+    def at(self, position: int) -> dict:
+        if position >= self.stored:
+            return self.pending[position - self.stored]
+        # Rows are never deleted, so ids are contiguous from 1
+        row = self.conn.execute("SELECT data FROM tools WHERE id >= ? ORDER BY id LIMIT 1", (position + 1,)).fetchone()
+        if row is None:
+            raise IndexError(position)
+        return json.loads(row[0])
+
+    def pick(self) -> dict:
+        return self.at(random.randrange(len(self)))
+
+    def update(self, title: str, fields: dict) -> None:
+        """Merge fields into a cached tool, matched by normalized title like ToolCatalog"""
+        normTitle = normalizeTitle(title)
+        for tool in self.pending:
+            if normalizeTitle(tool['title']) == normTitle:
+                tool.update(fields)
+        self.queue(self.updateRow, normTitle, fields)
+
+    def updateRow(self, normTitle: str, fields: dict) -> None:
+        row = self.writer.execute("SELECT id, data FROM tools WHERE norm_title = ? ORDER BY id LIMIT 1", (normTitle,)).fetchone()
+        if row is not None:
+            data = json.loads(row[1])
+            data.update(fields)
+            self.writer.execute("UPDATE tools SET data = ? WHERE id = ?", (json.dumps(data), row[0]))
+
+    def queue(self, op, *args) -> None:
+        self.ops.append((op, args))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup/migration/scripts): write straight away
+            ops = self.takeOps()
+            self.commitOps(ops)
+            self.committed(ops)
+            return
+        if self.writeTask is None or self.writeTask.done():
+            self.writeTask = loop.create_task(self.writeQueued())
+
+    def takeOps(self) -> list:
+        ops, self.ops = self.ops, []
+        return ops
+
+    async def writeQueued(self) -> None:
+        async with self.writeLock:
+            while self.ops:
+                ops = self.takeOps()
+                try:
+                    await asyncio.to_thread(self.commitOps, ops)
+                except sqlite3.Error as e:
+                    # Back to the head of the queue, retried with the next write. Unwritten tools stay served from memory
+                    self.ops[:0] = ops
+                    log(f"Failed to write {self.path}, {len(self.ops)} writes kept for retry: {e}", "ERROR")
+                    return
+                self.committed(ops)
+
+    def commitOps(self, ops: list) -> None:
+        with self.writer:
+            for op, args in ops:
+                op(*args)
+
+    async def snapshot(self) -> list[dict]:
+        """Every tool, read in the worker thread after all queued writes"""
+        await self.writeQueued()
+        async with self.writeLock:
+            rows = await asyncio.to_thread(lambda: self.writer.execute("SELECT data FROM tools ORDER BY id").fetchall())
+        # Anything still pending was added while the scan ran
+        return [json.loads(data) for (data,) in rows[:self.stored]] + list(self.pending)
+
+    async def close(self) -> None:
+        if self.writeTask and not self.writeTask.done():
+            await self.writeTask
+        if self.ops:
+            await self.writeQueued()
+        for conn in (self.conn, self.writer):
+            if conn:
+                conn.close()
+        self.conn = self.writer = None
+
+def migrateJsonToSqlite(jsonPath: str, catalog: SqliteToolCatalog) -> int:
+    """One-shot import of an existing tool_cache.json into the SQLite catalog"""
+    try:
+        with open(jsonPath, 'r') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        log(f"Nothing to migrate from {jsonPath}: {e}", "WARNING")
+        return 0
+    added = catalog.add(data)
+    log(f"Migrated {len(added)} tools from {jsonPath} to {catalog.path}", "SUCCESS")
+    return len(added)
+
+toolCatalog = SqliteToolCatalog() if CACHE_BACKEND == "sqlite" else ToolCatalog()
+metrics.collect("catalog", lambda: {"tools": len(toolCatalog)})
+
+
+# ---------------- Seen Tools ---------------- #
+SEEN_FILE = "seen_tools.bin"
+SEEN_LIMIT = int(os.getenv("SEEN_LIMIT", 20000))      # Oldest keys are forgotten past this, 8 bytes each on disk
+SEEN_STOP_RUN = 10                                     # Known feed entries in a row before the rest is assumed seen
+
+class SeenSet:
+    """Every tool the feed has been announced with, as 64-bit digests of its slug, oldest first"""
+    def __init__(self, path: str = SEEN_FILE, limit: int = SEEN_LIMIT):
+        self.path = path
+        self.limit = limit
+        self.keys: dict[bytes, None] = {}     # Insertion ordered, so the oldest key is evicted first
+        self.seeded = False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, tool: dict) -> bool:
+        return self.key(tool) in self.keys
+
+    @staticmethod
+    def key(tool: dict) -> bytes:
+        return hashlib.blake2b(toolSlug(tool).encode(), digest_size=8).digest()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            log(f"No seen list at {self.path}, it will be seeded from the feed", "WARNING")
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            log(f"Failed to read seen list: {e}", "ERROR")
+            return
+        self.keys = dict.fromkeys(data[i:i + 8] for i in range(0, len(data) - len(data) % 8, 8))
+        self.seeded = True
+        log(f"Seen list loaded: {len(self.keys)} tools", "INFO")
+
+    def add(self, tools) -> None:
+        """Mark tools as seen, given newest first like the feed"""
+        for tool in reversed(list(tools)):
+            key = self.key(tool)
+            self.keys.pop(key, None)
+            self.keys[key] = None
+        while len(self.keys) > self.limit:
+            del self.keys[next(iter(self.keys))]
+        self.seeded = True
+
+    async def save(self) -> None:
+        """Replace the seen file from a worker thread. The keys are joined first, on the loop"""
+        data = b"".join(self.keys)
+        await asyncio.to_thread(writeAtomic, self.path, lambda f: f.write(data), "wb")
+
+seenTools = SeenSet()
+metrics.collect("seen_tools", lambda: {"size": len(seenTools)})
+
+
+# ---------------- Search Index ---------------- #
+FUZZY_SUGGEST_SCORE = float(os.getenv("FUZZY_SUGGEST_SCORE", 0.45))  # Minimum similarity to suggest without scraping
+
+def trigrams(text: str) -> set[str]:
+    # Separators are dropped so "tool 5", "tool-5" and "tool5" compare equal
+    padded = f"  {''.join(ch for ch in text if ch.isalnum())} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class FuzzyIndex:
+    """In-memory trigram index over cached tool titles and slugs"""
+    def __init__(self):
+        self.exact: dict[str, dict] = {}
+        self.keys: list[tuple[dict, int]] = []    # (tool, trigram count) per indexed key
+        self.grams: dict[str, list[int]] = {}     # Trigram -> positions in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, tool: dict) -> None:
+        for key in (normalizeTitle(tool['title']), toolSlug(tool)):
+            if key in self.exact:
+                continue
+            self.exact[key] = tool
+            keyGrams = trigrams(key)
+            position = len(self.keys)
+            self.keys.append((tool, len(keyGrams)))
+            for gram in keyGrams:
+                self.grams.setdefault(gram, []).append(position)
+
+    def get(self, query: str) -> dict | None:
+        """Exact match on title or slug"""
+        return self.exact.get(normalizeTitle(query)) or self.exact.get(slugify(query))
+
+    def search(self, query: str, limit: int = 5) -> list[tuple[float, dict]]:
+        """Closest tools by trigram (Dice) similarity, best first"""
+        queryGrams = trigrams(normalizeTitle(query))
+        shared = Counter()
+        for gram in queryGrams:
+            shared.update(self.grams.get(gram, ()))
+
+        best: dict[str, tuple[float, dict]] = {}
+        for position, count in shared.items():
+            tool, size = self.keys[position]
+            score = 2 * count / (len(queryGrams) + size)
+            if score > best.get(tool['title'], (0.0,))[0]:
+                best[tool['title']] = (score, tool)
+        return sorted(best.values(), key=lambda match: match[0], reverse=True)[:limit]
+
+class PrefixIndex:
+    """Sorted array of (normalized title, title) for autocomplete prefix lookups"""
+    def __init__(self):
+        self.entries: list[tuple[str, str]] = []
+        self.keys: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, title: str) -> None:
+        key = normalizeTitle(title)
+        if key not in self.keys:
+            self.keys.add(key)
+            bisect.insort(self.entries, (key, title))
+
+    def build(self, titles) -> None:
+        entries = {normalizeTitle(title): title for title in reversed(list(titles))}
+        self.keys = set(entries)
+        self.entries = sorted(entries.items())
+
+    def complete(self, prefix: str, limit: int = 25) -> list[str]:
+        key = normalizeTitle(prefix)
+        position = bisect.bisect_left(self.entries, (key,))
+        matches = []
+        for entryKey, title in self.entries[position:position + limit]:
+            if not entryKey.startswith(key):
+                break
+            matches.append(title)
+        return matches
+
+searchIndex = FuzzyIndex()
+prefixIndex = PrefixIndex()
+
+def buildSearchIndex() -> None:
+    titles = []
+    for tool in toolCatalog:
+        searchIndex.add(tool)
+        titles.append(tool['title'])
+    prefixIndex.build(titles)
+    log(f"Search index built: {len(searchIndex)} keys, {len(prefixIndex)} titles", "INFO")
+
+
+# ---------------- Scrape Cache ---------------- #
+SCRAPE_CACHE_SIZE = int(os.getenv("SCRAPE_CACHE_SIZE", 256))                    # Pages kept in memory
+SCRAPE_CACHE_TTL = float(os.getenv("SCRAPE_CACHE_TTL", 6 * 60 * 60))            # Seconds a found page stays fresh
+SCRAPE_CACHE_NEGATIVE_TTL = float(os.getenv("SCRAPE_CACHE_NEGATIVE_TTL", 600))  # Seconds a 404 is remembered
+MISSING = object()
+
+class TTLCache:
+    """Bounded LRU cache with separate TTLs for found (truthy) and missing (empty) results"""
+    def __init__(self, maxSize: int, ttl: float, negativeTtl: float):
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.negativeTtl = negativeTtl
+        self.entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.hits = 0
+        self.negativeHits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str):
+        """Return the cached value, or MISSING if absent or expired"""
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < clock.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return MISSING
+        self.entries.move_to_end(key)
+        if entry[1]:
+            self.hits += 1
+        else:
+            self.negativeHits += 1
+        return entry[1]
+
+    def set(self, key: str, value) -> None:
+        ttl = self.ttl if value else self.negativeTtl
+        self.entries[key] = (clock.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negativeHits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "negativeHits": self.negativeHits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRatio": (self.hits + self.negativeHits) / lookups if lookups else 0.0,
+        }
+
+scrapeCache = TTLCache(SCRAPE_CACHE_SIZE, SCRAPE_CACHE_TTL, SCRAPE_CACHE_NEGATIVE_TTL)
+metrics.collect("scrape_cache", scrapeCache.stats, counters=("hits", "negativeHits", "misses", "evictions"))
+
+
+# ---------------- Tool of the Week Schedule ---------------- #
+TOTW_WEEKDAY = 2                                                         # Wednesday
+TOTW_ROTATION_HOUR = int(os.getenv("TOTW_ROTATION_HOUR", 0))             # Eastern hour the pick changes
+TOTW_POST_TIME = time(hour=int(os.getenv("TOTW_POST_HOUR", 12)), tzinfo=EASTERN)
+TOTW_POST_RETRIES = [time(hour=hour, tzinfo=EASTERN) for hour in range(TOTW_POST_TIME.hour + 1, 24)]  # If the site hasn't rotated yet
+TOTW_REVALIDATE_WINDOW = datetime.timedelta(hours=12)                    # How long after the boundary an unknown pick is rechecked
+TOTW_REVALIDATE_INTERVAL = datetime.timedelta(minutes=15)                # First recheck, doubling while the pick stays unconfirmed
+TOTW_REVALIDATE_MAX = datetime.timedelta(hours=2)
+
+# Stores the current pick until it expires, plus validators for cheap rechecks
+totwCache = {"tools": [], "expires": None, "week": None, "previousTitle": None, "etag": None, "lastModified": None, "rechecks": 0, "postedWeek": None, "postedTitle": None}
+
+def nextTotwRotation(now: datetime.datetime) -> datetime.datetime:
+    now = now.astimezone(EASTERN)
+    daysAhead = (TOTW_WEEKDAY - now.weekday()) % 7
+    boundary = datetime.datetime.combine(now.date() + datetime.timedelta(days=daysAhead), time(hour=TOTW_ROTATION_HOUR), tzinfo=EASTERN)
+    if boundary <= now:
+        boundary += datetime.timedelta(days=7)
+    return boundary
+
+def lastTotwRotation(now: datetime.datetime) -> datetime.datetime:
+    return nextTotwRotation(now) - datetime.timedelta(days=7)
+
+def storeTotw(tools: list[dict], now: datetime.datetime) -> None:
+    """Cache the pick until the next rotation, or briefly if it may not have rotated yet"""
+    week = lastTotwRotation(now)
+    if totwCache["week"] is not None and totwCache["week"] < week and totwCache["tools"]:
+        totwCache["previousTitle"] = totwCache["tools"][0]['title']
+
+    expires = nextTotwRotation(now)
+    # Still showing last week's pick: keep rechecking, backing off, for as long as it takes.
+    # With nothing to compare against (fresh start) only the hours after the boundary are in doubt
+    stale = tools[0]['title'] == totwCache["previousTitle"]
+    unknown = totwCache["previousTitle"] is None and now - week < TOTW_REVALIDATE_WINDOW
+    if stale or unknown:
+        backoff = min(TOTW_REVALIDATE_INTERVAL * 2 ** totwCache["rechecks"], TOTW_REVALIDATE_MAX)
+        totwCache["rechecks"] += 1
+        expires = min(now + backoff, expires)
+    else:
+        totwCache["rechecks"] = 0
+
+    totwCache.update(tools=tools, expires=expires, week=week)
+    log(f"'toolOfTheWeek' cached until {expires.strftime('%a %Y-%m-%d %I:%M %p %Z')}", "TOTW")
+
+
+# ---------------- Poll Schedule ---------------- #
+POLL_INTERVAL = float(os.getenv("POLL_INTERVAL", 60))           # Average minutes between feed polls, sets the daily request budget
+POLL_MIN_INTERVAL = float(os.getenv("POLL_MIN_INTERVAL", 10))
+POLL_MAX_INTERVAL = float(os.getenv("POLL_MAX_INTERVAL", 240))
+POLL_JITTER = 0.1            # +/- share of every interval, so polls don't settle on the same minute
+POLL_STEP = 5                # Minutes the schedule is walked forward in
+POLL_HISTORY = 200           # Publish times kept for the cadence model
+POLL_QUIET_GAPS = 3          # Silent for this many typical gaps and the feed counts as quiet
+
+def parseFeedTime(value: str | None) -> datetime.datetime | None:
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(EASTERN)
+    except (AttributeError, ValueError):
+        return None
+
+class PollScheduler:
+    """Spends the POLL_INTERVAL request budget where tools usually land, and less where they don't"""
+    def __init__(self):
+        self.published: list[datetime.datetime] = []
+        self.errors = 0
+        self.interval = POLL_INTERVAL
+
+    def observe(self, tools) -> None:
+        """Learn from feed entries' 'updated' timestamps"""
+        stamps = {parseFeedTime(tool.get("updated")) for tool in tools}
+        stamps.discard(None)
+        self.published = sorted(stamps.union(self.published))[-POLL_HISTORY:]
+
+    def succeeded(self) -> None:
+        self.errors = 0
+
+    def failed(self) -> None:
+        self.errors += 1
+
+    def hourlyScale(self) -> list[float]:
+        """Interval multiplier per Eastern hour. Polls are spread in proportion to the square root
+        of each hour's publish rate, which minimises average detection delay for a fixed budget"""
+        counts = [0.5] * 24     # Smoothing, so an hour never seen still gets polled
+        for stamp in self.published:
+            counts[stamp.hour] += 1
+        roots = [count ** 0.5 for count in counts]
+        mean = sum(roots) / 24
+        return [mean / root for root in roots]
+
+    def quietFactor(self, now: datetime.datetime) -> float:
+        """How far past its usual cadence the feed has gone silent, 1 while it is on schedule"""
+        if len(self.published) < 2:
+            return 1.0
+        gaps = sorted((b - a).total_seconds() for a, b in zip(self.published, self.published[1:]))
+        typical = gaps[len(gaps) // 2]
+        if typical <= 0:
+            return 1.0
+        silence = (now - self.published[-1]).total_seconds()
+        return min(4.0, max(1.0, silence / (typical * POLL_QUIET_GAPS)))
+
+    def nextInterval(self, now: datetime.datetime | None = None) -> float:
+        """Minutes until the next poll"""
+        now = now or datetime.datetime.now(EASTERN)
+        if self.errors:
+            interval = POLL_INTERVAL * 2 ** min(self.errors - 1, 5)
+        else:
+            scale = self.hourlyScale()
+            quiet = self.quietFactor(now)
+            # Walk forward until the poll rate of the hours ahead adds up to one request
+            interval, credit = 0.0, 0.0
+            while credit < 1 and interval < POLL_MAX_INTERVAL:
+                hour = (now + datetime.timedelta(minutes=interval)).hour
+                credit += POLL_STEP / max(POLL_INTERVAL * scale[hour] * quiet, POLL_MIN_INTERVAL)
+                interval += POLL_STEP
+
+        interval *= random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+        self.interval = min(max(interval, POLL_MIN_INTERVAL), POLL_MAX_INTERVAL)
+        return self.interval
+
+pollScheduler = PollScheduler()
+metrics.collect("feed_poll", lambda: {"intervalMinutes": pollScheduler.interval, "errors": pollScheduler.errors, "publishTimes": len(pollScheduler.published)})
+
+
+# ---------------- Send Queue ---------------- #
+SEND_WORKERS = int(os.getenv("SEND_WORKERS", 4))
+SEND_CHANNEL_RATE = (5, 5.0)     # Messages per seconds, Discord's per-channel send limit
+SEND_GLOBAL_RATE = (50, 1.0)     # Requests per second across the bot
+SEND_MAX_ROUTES = 1000           # Buckets / cached channels kept before the least recent is dropped
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+class TokenBucket:
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = clock.monotonic()
+
+    def take(self) -> float:
+        """Take a token if one is available. Returns 0, or the seconds until one will be"""
+        now = clock.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        while (wait := self.take()) > 0:
+            await asyncio.sleep(wait)
+
+    def drain(self) -> None:
+        self.tokens = 0.0
+        self.updated = clock.monotonic()
+
+class SendQueue:
+    """Outbound Discord messages, paced per route and globally. Interactive replies go before announcements"""
+    def __init__(self, workers: int = SEND_WORKERS):
+        self.workerCount = workers
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.workers: list[asyncio.Task] = []
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.globalBucket = TokenBucket(*SEND_GLOBAL_RATE)
+        self.channels: OrderedDict[int, discord.abc.Messageable] = OrderedDict()
+        self.sequence = 0
+        self.sent = 0
+        self.failed = 0
+        self.rateLimited = 0
+        self.totalDelay = 0.0
+        self.maxDelay = 0.0
+        self.recent: deque[float] = deque(maxlen=1000)   # Send times, for throughput
+
+    async def send(self, route: str, factory, priority: int = PRIORITY_BACKGROUND):
+        """Queue factory() (a coroutine function doing one Discord request) and wait for its result"""
+        self.ensureWorkers()
+        future = asyncio.get_running_loop().create_future()
+        self.sequence += 1
+        self.queue.put_nowait((priority, self.sequence, clock.monotonic(), route, factory, future))
+        return await future
+
+    async def getChannel(self, channelId: int):
+        """Gateway cache first, then our own cache, and only then a REST fetch"""
+        channel = bot.get_channel(channelId) or self.channels.get(channelId)
+        if channel is None:
+            channel = await bot.fetch_channel(channelId)
+            self.channels[channelId] = channel
+            if len(self.channels) > SEND_MAX_ROUTES:
+                self.channels.popitem(last=False)
+        return channel
+
+    def bucket(self, route: str) -> TokenBucket:
+        bucket = self.buckets.get(route)
+        if bucket is None:
+            bucket = self.buckets[route] = TokenBucket(*SEND_CHANNEL_RATE)
+            if len(self.buckets) > SEND_MAX_ROUTES:
+                self.buckets.popitem(last=False)
+        self.buckets.move_to_end(route)
+        return bucket
+
+    def ensureWorkers(self) -> None:
+        if not self.workers:
+            self.workers = [asyncio.create_task(self.worker()) for _ in range(self.workerCount)]
+
+    async def stop(self) -> None:
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def worker(self) -> None:
+        while True:
+            item = await self.queue.get()
+            _, _, queuedAt, route, factory, future = item
+            try:
+                if future.cancelled():
+                    continue
+                # A busy channel is put back until its bucket refills, so it never holds up other routes
+                wait = self.bucket(route).take()
+                if wait > 0:
+                    asyncio.get_running_loop().call_later(wait, self.queue.put_nowait, item)
+                    continue
+                await self.globalBucket.acquire()
+
+                delay = clock.monotonic() - queuedAt
+                self.totalDelay += delay
+                self.maxDelay = max(self.maxDelay, delay)
+                try:
+                    result = await factory()
+                except Exception as e:
+                    self.failed += 1
+                    if isinstance(e, discord.NotFound) and route.startswith("channel:"):
+                        self.channels.pop(int(route.split(":", 1)[1]), None)
+                    elif isinstance(e, discord.HTTPException) and e.status == 429:
+                        self.rateLimited += 1
+                        self.bucket(route).drain()
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    self.sent += 1
+                    self.recent.append(clock.monotonic())
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self.queue.task_done()
+
+    def stats(self) -> dict:
+        now = clock.monotonic()
+        done = self.sent + self.failed
+        return {
+            "queued": self.queue.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "rateLimited": self.rateLimited,
+            "sentLastMinute": sum(1 for sentAt in self.recent if now - sentAt <= 60),
+            "avgDelay": self.totalDelay / done if done else 0.0,
+            "maxDelay": self.maxDelay,
+        }
+
+sendQueue = SendQueue()
+metrics.collect("send_queue", sendQueue.stats, counters=("sent", "failed", "rateLimited"))
+
+async def followup(interaction: discord.Interaction, *args, **kwargs):
+    """interaction.followup.send through the send queue, ahead of background announcements"""
+    with span("send"):
+        return await sendQueue.send(f"interaction:{interaction.id}", lambda: interaction.followup.send(*args, **kwargs), PRIORITY_INTERACTIVE)
+
+
 # ---------------- Bot Setup ---------------- #
+class TroveBot(commands.Bot):
+    async def setup_hook(self):
+        # Page buttons carry their own state, so clicks work on messages sent before a restart
+        self.add_dynamic_items(PageButton)
+        await metricsServer.start()
+
+    async def close(self):
+        await mediaEnricher.stop()
+        await sendQueue.stop()
+        await toolCatalog.close()
+        await httpClient.close()
+        parsePool.shutdown()
+        await metricsServer.stop()
+        await super().close()
+
 intents = discord.Intents.default() 
-bot = commands.Bot(command_prefix="?", intents=intents)
+bot = TroveBot(command_prefix="?", intents=intents)
 tree = bot.tree
 
 # ---------------- Save/Load Config ---------------- #
 def saveConfig():
-    """Save the current CHANNEL_ID to a JSON file."""
+    """Save the current CHANNEL_ID and per-guild settings to a JSON file."""
     data = {
         "channel_id": CHANNEL_ID,
         "owner_id": OWNER_ID,
         "last_posted_title": LAST_POSTED_TITLE,
-        "ping_role_id": PING_ROLE_ID
+        "ping_role_id": PING_ROLE_ID,
+        "guilds": {str(guildId): config for guildId, config in guild_configs.items()},
+        "totw": {
+            "posted_week": totwCache["postedWeek"].isoformat() if totwCache["postedWeek"] else None,
+            "posted_title": totwCache["postedTitle"],
+        },
     }
     with open(CONFIG_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
@@ -111,83 +1365,473 @@ def loadConfig():
                 # Load Ping Role ID
                 PING_ROLE_ID = data.get("ping_role_id", None)
                 log(f"'PING_ROLE_ID Set: <{PING_ROLE_ID}>", "INFO")
+
+                # Load Guild Configs (JSON keys are strings)
+                for guildId, config in data.get("guilds", {}).items():
+                    guild_configs[int(guildId)] = {"channel_id": config.get("channel_id"), "ping_role_id": config.get("ping_role_id")}
+                log(f"'guild_configs' Loaded: {len(guild_configs)} guilds", "INFO")
+
+                # Load the last weekly TOTW post, so a restart doesn't post it again
+                totw = data.get("totw") or {}
+                if totw.get("posted_week"):
+                    totwCache["postedWeek"] = datetime.datetime.fromisoformat(totw["posted_week"])
+                    totwCache["postedTitle"] = totw.get("posted_title")
+                    if totwCache["postedWeek"] < lastTotwRotation(datetime.datetime.now(EASTERN)):
+                        # Posted in an earlier week: that's the pick the site is rotating away from
+                        totwCache["previousTitle"] = totwCache["postedTitle"]
+                    log(f"'TOTW' Last posted: <{totwCache['postedTitle']}> for the week of {totwCache['postedWeek'].date()}", "INFO")
                 
                 log(f"Configuration: {CONFIG_FILE}", "INFO")
         except Exception as e:
             log(f"Failed to load config: {e}", "ERROR")
 
+def guildConfig(guildId: int) -> dict[str, int | None]:
+    return guild_configs.setdefault(guildId, {"channel_id": None, "ping_role_id": None})
+
+async def migrateLegacyConfig():
+    """Move the single global CHANNEL_ID/PING_ROLE_ID into the guild that owns that channel"""
+    if not CHANNEL_ID or any(config.get("channel_id") == int(CHANNEL_ID) for config in guild_configs.values()):
+        return
+    try:
+        channel = await sendQueue.getChannel(int(CHANNEL_ID))
+    except discord.HTTPException as e:
+        log(f"Could not migrate legacy CHANNEL_ID {CHANNEL_ID}: {e}", "WARNING")
+        return
+    config = guildConfig(channel.guild.id)
+    if not config["channel_id"]:
+        config["channel_id"] = int(CHANNEL_ID)
+        config["ping_role_id"] = int(PING_ROLE_ID) if PING_ROLE_ID else None
+        saveConfig()
+        log(f"Legacy CHANNEL_ID {CHANNEL_ID} migrated to guild {channel.guild.id}", "SUCCESS")
+
+# ---------------- HTML Extraction ---------------- #
+# Everything the scrapers read from a page:
+#   main    - whether the page has a <main>
+#   images  - src of every <img> inside the first <main>
+#   h1      - text of the first <h1> in the document
+#   h2      - text of the first <h2> inside <main>
+#   small   - text of the first <small> inside <main>
+#   tagline - text of the first <p id="tagline"> in the document
+# Text matches BeautifulSoup's get_text(strip=True); missing elements are None
+PAGE_PARTS = ("images", "h1", "h2", "small", "tagline")
+SEARCH_PARTS = ("images", "h1", "tagline")   # Tool pages, read by fetchSearch
+TOTW_PARTS = ("images", "h2", "small")       # Tool of the Week page, read by fetchToolOfTheWeek
+HTML_BACKEND = os.getenv("HTML_BACKEND", "fast").lower()   # "fast", "lxml" (opt-in, see PARITY_PAGES) or "bs4"
+HTML_CHUNK_SIZE = 8 * 1024  # Small enough that parsing stops soon after </main>
+
+def emptyParts() -> dict:
+    return {"main": False, "images": [], "h1": None, "h2": None, "small": None, "tagline": None}
+
+class PagePartsParser(HTMLParser):
+    """Streams the page and keeps only the targeted elements, no tree is built"""
+    def __init__(self, targets):
+        super().__init__(convert_charrefs=True)
+        self.targets = set(targets)
+        self.parts = emptyParts()
+        self.mainDepth = 0
+        self.mainClosed = False
+        self.captures: list[list] = []   # [part, tag, depth, inMain, chunks] for each open target
+        self.pendingText: list[str] = []
+
+    def done(self) -> bool:
+        """True once nothing later in the page can change the result"""
+        if self.captures or not self.mainClosed:
+            return False
+        return all(self.parts[part] is not None for part in ("h1", "tagline") if part in self.targets)
+
+    def flushText(self) -> None:
+        # BeautifulSoup strips each text run between tags, then joins them
+        if self.pendingText:
+            text = "".join(self.pendingText).strip()
+            self.pendingText = []
+            if text:
+                for capture in self.captures:
+                    capture[4].append(text)
+
+    def handle_data(self, data):
+        if self.captures:
+            self.pendingText.append(data)
+
+    def handle_comment(self, data):
+        self.flushText()
+
+    def handle_starttag(self, tag, attrs):
+        self.flushText()
+        if tag == "main" and not self.mainClosed:
+            self.parts["main"] = True
+            self.mainDepth += 1
+        inMain = self.mainDepth > 0
+
+        for capture in self.captures:
+            if capture[1] == tag:
+                capture[2] += 1
+
+        part = None
+        if tag == "img":
+            if inMain and "images" in self.targets:
+                self.parts["images"].append(dict(attrs).get("src") or "")
+            return
+        elif tag == "h1":
+            part = "h1"
+        elif tag in ("h2", "small") and inMain:
+            part = tag
+        elif tag == "p" and ("id", "tagline") in attrs:
+            part = "tagline"
+
+        if part in self.targets and self.parts[part] is None and not any(capture[0] == part for capture in self.captures):
+            self.captures.append([part, tag, 1, inMain, []])
+
+    def handle_endtag(self, tag):
+        self.flushText()
+        if tag == "main" and self.mainDepth > 0:
+            self.mainDepth -= 1
+            if self.mainDepth == 0:
+                self.mainClosed = True
+                # Closing <main> also closes anything left open inside it
+                for capture in [capture for capture in self.captures if capture[3]]:
+                    self.finishCapture(capture)
+
+        for capture in list(self.captures):
+            if capture[1] == tag:
+                capture[2] -= 1
+                if capture[2] == 0:
+                    self.finishCapture(capture)
+
+    def finishCapture(self, capture: list) -> None:
+        self.captures.remove(capture)
+        self.parts[capture[0]] = "".join(capture[4])
+
+    def close(self):
+        super().close()
+        self.flushText()
+        for capture in list(self.captures):
+            self.finishCapture(capture)
+
+def extractWithParser(html: str, targets=PAGE_PARTS) -> dict:
+    parser = PagePartsParser(targets)
+    for start in range(0, len(html), HTML_CHUNK_SIZE):
+        parser.feed(html[start:start + HTML_CHUNK_SIZE])
+        if parser.done():
+            break
+    parser.close()
+    return parser.parts
+
+def extractWithBs4(html: str, targets=PAGE_PARTS) -> dict:
+    """Reference backend: full BeautifulSoup tree, as the scrapers originally did"""
+    soup = BeautifulSoup(html, 'html.parser')
+    parts = emptyParts()
+    mainContent = soup.find('main')
+    if mainContent:
+        parts["main"] = True
+        parts["images"] = [img.get('src', '') for img in mainContent.find_all('img')]
+        for tag in ("h2", "small"):
+            element = mainContent.find(tag)
+            parts[tag] = element.get_text(strip=True) if element else None
+    element = soup.find('h1')
+    parts["h1"] = element.get_text(strip=True) if element else None
+    element = soup.find('p', id='tagline')
+    parts["tagline"] = element.get_text(strip=True) if element else None
+    return parts
+
+def extractWithLxml(html: str, targets=PAGE_PARTS) -> dict:
+    """libxml2 backend. Note lxml applies HTML implied-end-tag rules that html.parser doesn't"""
+    document = lxmlHtml.fromstring(html)
+    text = lambda element: "".join(chunk.strip() for chunk in element.itertext()) if element is not None else None
+    parts = emptyParts()
+    # iter() includes the element itself, fromstring() returns a bare <main> for fragments
+    first = lambda root, tag: next(root.iter(tag), None)
+    mainContent = first(document, 'main')
+    if mainContent is not None:
+        parts["main"] = True
+        parts["images"] = [img.get('src') or "" for img in mainContent.iter('img')]
+        parts["h2"] = text(first(mainContent, 'h2'))
+        parts["small"] = text(first(mainContent, 'small'))
+    parts["h1"] = text(first(document, 'h1'))
+    taglines = document.xpath('//p[@id="tagline"]')
+    parts["tagline"] = text(taglines[0]) if taglines else None
+    return parts
+
+HTML_BACKENDS = {"fast": extractWithParser, "bs4": extractWithBs4}
+if lxmlHtml is not None:
+    HTML_BACKENDS["lxml"] = extractWithLxml
+
+def extractPage(html: str, targets=PAGE_PARTS, backend: str = HTML_BACKEND) -> dict:
+    """Pull the targeted parts out of a page with the configured backend"""
+    return HTML_BACKENDS.get(backend, extractWithParser)(html, targets)
+
+# Implied end tags: html.parser (bs4 and fast) keeps the <p> inside the <h2> and the <div> inside the
+# unclosed tagline, lxml closes the element first and returns less text
+PARITY_PAGES = (
+    "<main><h2>title<p>para</p></main>",
+    "<main><h1>Tool</h1></main><p id='tagline'>A fast <div>terminal</div> tool",
+)
+
+def backendMismatches(html: str, targets=PAGE_PARTS, backends=None) -> list[str]:
+    """Backends that read the targeted parts of a page differently from the bs4 reference"""
+    expected = extractWithBs4(html)
+    mismatches = []
+    for backend in backends or HTML_BACKENDS:
+        parts = HTML_BACKENDS[backend](html, targets)
+        # Backends only fill the parts they were asked for
+        differing = [part for part in ("main",) + tuple(targets) if parts[part] != expected[part]]
+        if differing:
+            mismatches.append(f"{backend} differs from bs4 on {', '.join(differing)}")
+    return mismatches
+
+def absoluteUrl(src: str) -> str:
+    return f"https://terminaltrove.com{src}" if src.startswith('/') else src
+
+
+# ---------------- Parse Pool ---------------- #
+PARSE_POOL = os.getenv("PARSE_POOL", "off").lower()                       # "off", "process" or "thread"
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+PARSE_QUEUE_LIMIT = int(os.getenv("PARSE_QUEUE_LIMIT", 16))                # Jobs in the pool before parsing inline
+WARMUP_HTML = ("<main><h1> warm <b>up</b> </h1><img src='/warmup.gif'><h2>Tool of <i>the</i> week</h2>"
+               "<small> warmup </small><img></main><p id='tagline'>a <code>warmup</code> page</p>")
+
+class ParsePool:
+    """Runs page extraction off the event loop in a bounded worker pool"""
+    def __init__(self, mode: str = PARSE_POOL, workers: int = PARSE_WORKERS, queueLimit: int = PARSE_QUEUE_LIMIT):
+        self.mode = mode
+        self.workers = workers
+        self.queueLimit = queueLimit
+        self.executor = None
+        self.pending = 0
+        self.offloaded = 0
+        self.inline = 0
+
+    def start(self) -> None:
+        """Create and pre-warm the workers. Call before the bot starts so processes fork from a quiet parent"""
+        backend = HTML_BACKEND if HTML_BACKEND in HTML_BACKENDS else "fast"
+        for html in (WARMUP_HTML,) + PARITY_PAGES:
+            for targets in (SEARCH_PARTS, TOTW_PARTS):
+                for mismatch in backendMismatches(html, targets, [backend]):
+                    log(f"HTML backend parity check failed: {mismatch}", "WARNING")
+        if self.mode == "process":
+            # Never fork: the log listener thread is already running, so start workers from a clean server process
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+        elif self.mode == "thread":
+            # Only worth it with a backend that releases the GIL while parsing (lxml)
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+        else:
+            return
+        warmups = [self.executor.submit(extractPage, WARMUP_HTML, PAGE_PARTS, HTML_BACKEND) for _ in range(self.workers)]
+        for warmup in warmups:
+            warmup.result()
+        log(f"Parse pool started: {self.workers} {self.mode} workers, queue limit {self.queueLimit}", "INFO")
+
+    async def extract(self, html: str, targets=PAGE_PARTS) -> dict:
+        with span("parse"), metrics.timer("parse_seconds", mode=self.mode if self.executor is not None else "inline"):
+            return await self.run(html, targets)
+
+    async def run(self, html: str, targets) -> dict:
+        # Saturated (or disabled) pool: parse inline rather than queue behind other pages
+        if self.executor is None or self.pending >= self.queueLimit:
+            self.inline += 1
+            return extractPage(html, targets)
+
+        self.pending += 1
+        try:
+            parts = await asyncio.get_running_loop().run_in_executor(self.executor, extractPage, html, targets, HTML_BACKEND)
+            self.offloaded += 1
+            return parts
+        except BrokenProcessPool as e:
+            log(f"Parse pool broken, parsing inline: {e}", "ERROR")
+            self.executor = None
+            self.inline += 1
+            return extractPage(html, targets)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers if self.executor is not None else 0,
+            "pending": self.pending,
+            "offloaded": self.offloaded,
+            "inline": self.inline,
+        }
+
+parsePool = ParsePool()
+metrics.collect("parse_pool", parsePool.stats, counters=("offloaded", "inline"))
+
+
 # ---------------- Helper Functions ---------------- #
+FEED_URL = "https://terminaltrove.com/new.xml"
+ATOM = "{http://www.w3.org/2005/Atom}"  # Namespace (Required for Atom feeds)
+
 async def getNewTools():
+    """Fetch Terminal Trove 'New Tools' RSS, sharing one download between concurrent callers"""
+    return await inFlight.do("newTools", fetchNewTools)
+
+async def fetchNewTools():
     """Fetch Terminal Trove 'New Tools' RSS"""
-    url="https://terminaltrove.com/new.xml"
+    content = await inFlight.do("feed", fetchFeed)
+    if content is None:
+        return []
+
+    # A 304 hands back the same body we already parsed
+    if lastToolCache["content"] is content and lastToolCache["tools"] is not None:
+        log(f"'newTool' feed unchanged, using {len(lastToolCache['tools'])} cached tools", "INFO")
+        return lastToolCache["tools"]
 
-    respsone = requests.get(url)
+    with span("parse"):
+        tools = list(iterFeedEntries(content))
+    if lastToolCache["content"] is content:
+        lastToolCache["tools"] = tools
+        lastToolCache["snapshot"] = hashlib.blake2b(content, digest_size=6).hexdigest()
+    return tools
 
-    if respsone.status_code != 200:
+def feedSnapshot(tools: list[dict]) -> str:
+    """Stable id for a tool list, used to share rendered pages between views"""
+    if tools is lastToolCache["tools"] and lastToolCache["snapshot"]:
+        return lastToolCache["snapshot"]
+    digest = hashlib.blake2b(digest_size=6)
+    for tool in tools:
+        digest.update(f"{tool['title']}\0{tool['link']}\0{tool['summary']}\n".encode())
+    return digest.hexdigest()
+
+async def getNewToolsSince(isKnown, stopAfter: int = 1) -> list[dict] | None:
+    """Feed entries isKnown() rejects. Parsing stops after stopAfter known entries in a row. None on fetch errors"""
+    content = await inFlight.do("feed", fetchFeed)
+    if content is None:
+        return None
+
+    if lastToolCache["content"] is content and lastToolCache["tools"] is not None:
+        entries = iter(lastToolCache["tools"])
+    else:
+        entries = iterFeedEntries(content)
+
+    fresh = []
+    knownRun = 0
+    for tool in entries:
+        if not isKnown(tool):
+            fresh.append(tool)
+            knownRun = 0
+            continue
+        knownRun += 1
+        if knownRun >= stopAfter:
+            break
+    return fresh
+
+async def seedSeenTools() -> list[dict] | None:
+    """First run: the whole feed counts as seen, except tools above the LAST_POSTED_TITLE older versions saved"""
+    global LAST_POSTED_TITLE
+    tools = await getNewToolsSince(lambda tool: False)
+    if tools is None:
+        return None
+
+    titles = [tool['title'] for tool in tools]
+    fresh = tools[:titles.index(LAST_POSTED_TITLE)] if LAST_POSTED_TITLE in titles else []
+    seenTools.add(tools[len(fresh):])
+    await seenTools.save()
+    log(f"Seen list seeded with {len(tools) - len(fresh)} tools", "INFO")
+
+    if LAST_POSTED_TITLE:
+        LAST_POSTED_TITLE = ""
+        saveConfig()
+    return fresh
+
+async def fetchFeed() -> bytes | None:
+    """Download 'new.xml' with a conditional GET. Returns the raw feed (the cached copy on a 304)"""
+    url = FEED_URL
+
+    # Only revalidate when we have a copy to fall back on
+    headers = {}
+    if lastToolCache["content"] is not None:
+        if lastToolCache["etag"]:
+            headers["If-None-Match"] = lastToolCache["etag"]
+        if lastToolCache["lastModified"]:
+            headers["If-Modified-Since"] = lastToolCache["lastModified"]
+
+    respsone = await httpClient.get(url, headers=headers)
+
+    if respsone is not None and respsone.status == 304:
+        return lastToolCache["content"]
+
+    if respsone is None or respsone.status != 200:
         log(f"Cannot Fetch 'newTools' URL: <{url}>", "ERROR")
-        return [] 
+        return None 
     else:
         log(f"'newTool' URL Found", "SUCCESS")
 
-    root = ET.fromstring(respsone.content)
-
-
-    # Define the Namespace (Required for Atom feeds)
-    ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-    tools = []
-    for entry in root.findall('atom:entry', ns):
-        toolData = {
-            "title": entry.find('atom:title',ns).text,
-            "summary": entry.find('atom:summary',ns).text,
-            "link": entry.find('atom:link', ns).get('href'),
-            # "updated": entry.find('atom:updated', ns ).text
-        }
-        tools.append(toolData)
-    return tools
+    lastToolCache["etag"] = respsone.headers.get("ETag")
+    lastToolCache["lastModified"] = respsone.headers.get("Last-Modified")
+    lastToolCache["content"] = respsone.content
+    lastToolCache["tools"] = None
+    return respsone.content
+
+def iterFeedEntries(content: bytes):
+    """Yield tools from the Atom feed as they are read, clearing parsed elements to keep memory flat"""
+    context = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+    _, root = next(context)
+    for event, entry in context:
+        if event == "end" and entry.tag == ATOM + "entry":
+            yield {
+                "title": entry.findtext(ATOM + "title"),
+                "summary": entry.findtext(ATOM + "summary"),
+                "link": entry.find(ATOM + "link").get('href'),
+                "updated": entry.findtext(ATOM + "updated")
+            }
+            # Drop every element read so far, the root only ever holds the current entry
+            root.clear()
 
 async def getToolOfTheWeek():
+    """Fetch Terminal Trove 'Tool of The Week', cached until the weekly rotation"""
+    if totwCache["tools"] and datetime.datetime.now(EASTERN) < totwCache["expires"]:
+        return totwCache["tools"]
+    return await inFlight.do("toolOfTheWeek", fetchToolOfTheWeek)
+
+async def fetchToolOfTheWeek():
     """Fetch Terminal Trove 'Tool of The Week' from HTML"""
     url = "https://terminaltrove.com/tool-of-the-week/"
-    headers = {"User-Agent": "Mozilla/5.0"}
+
+    headers = {}
+    if totwCache["tools"]:
+        if totwCache["etag"]:
+            headers["If-None-Match"] = totwCache["etag"]
+        if totwCache["lastModified"]:
+            headers["If-Modified-Since"] = totwCache["lastModified"]
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await httpClient.get(url, headers=headers)
+
+        if response is not None and response.status == 304:
+            storeTotw(totwCache["tools"], datetime.datetime.now(EASTERN))
+            return totwCache["tools"]
 
-        if response.status_code != 200:
+        if response is None or response.status != 200:
             log(f"Cannot Fetch 'toolOfTheWeek' URL: <{url}>", "ERROR")
             return []
         
         log(f"'toolOfTheWeek' URL Loaded", "SUCCESS")
-        soup = BeautifulSoup(response.text, 'html.parser')
+        parts = await parsePool.extract(response.text, TOTW_PARTS)
         results = []
         
-        mainContent = soup.find('main')
-        if not mainContent:
+        if not parts["main"]:
             log("Could not find <main> content for TOTW", "ERROR")
             return []
 
-        # Find the main visual (Banner or GIF)
+        # The main visual (Banner or GIF) is the first image
         picUrl = None
-        for img in mainContent.find_all('img'):
-            src = img.get('src', '')
+        if parts["images"]:
+            src = parts["images"][0]
+            picUrl = absoluteUrl(src)
             if any(src.endswith(ext) for ext in ['.png','.jpg']):
-                picUrl = f"https://terminaltrove.com{src}" if src.startswith('/') else src
                 log("'toolOfTheWeek' PNG Found", "SUCCESS")
-                break
             else:
-                picUrl = f"https://terminaltrove.com{src}" if src.startswith('/') else src
                 log("'toolOfTheWeek' GIF Found", "SUCCESS")
-                break
 
-        
         # Grab the title
-        titleEl = mainContent.find('h2')
-        title = titleEl.get_text(strip=True) if titleEl else "Tool of the Week"
+        title = parts["h2"] if parts["h2"] is not None else "Tool of the Week"
         
-        # Grab the first paragraph for the description
-        summaryEl = mainContent.find('small')
-        summary = summaryEl.get_text(strip=True) if summaryEl else "No description available."
+        # Grab the first <small> for the description
+        summary = parts["small"] if parts["small"] is not None else "No description available."
 
         results.append({
             "title": title,
@@ -196,62 +1840,67 @@ async def getToolOfTheWeek():
             "gif": picUrl, 
             "updated": datetime.datetime.now().strftime("%Y-%m-%d")
         })
-        
+
+        totwCache["etag"] = response.headers.get("ETag")
+        totwCache["lastModified"] = response.headers.get("Last-Modified")
+        storeTotw(results, datetime.datetime.now(EASTERN))
         return results
 
     except Exception as e:
         log(f"TOTW Scrape Error: {e}", "ERROR")
         return []
     
-    # Searches tool_cahce.json for tools 
+    # Scrapes a tool page by its slug, None if the page couldn't be loaded
 async def scrapeSearch(query: str):
-    cleanQuery = query.lower().replace(" ", "-").strip("/")
+    cleanQuery = slugify(query)
+
+    cached = scrapeCache.get(cleanQuery)
+    if cached is not MISSING:
+        return [dict(tool) for tool in cached]
+
+    results = await inFlight.do(f"scrape:{cleanQuery}", lambda: fetchSearch(query, cleanQuery))
+    return [dict(tool) for tool in results] if results is not None else None
+
+async def fetchSearch(query: str, cleanQuery: str):
     url = f"https://terminaltrove.com/{cleanQuery}/"
-    headers = {"User-Agent": "Mozilla/5.0"}
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            return []
+        response = await httpClient.get(url)
+        if response is None:
+            return None
+        if response.status != 200:
+            # Remember pages that don't exist, retry anything else next time
+            if response.status == 404:
+                scrapeCache.set(cleanQuery, [])
+                return []
+            return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        parts = await parsePool.extract(response.text, SEARCH_PARTS)
         results = []
+
+        if not parts["main"]:
+            log(f"Could not find <main> content for <{url}>", "ERROR")
+            return []
         
+        # Extract Title and Tagline 
+        title = parts["h1"] if parts["h1"] is not None else query.capitalize()
+        tagline = parts["tagline"] if parts["tagline"] is not None else "Terminal tool found on Terminal Trove."
+
         # Find the Image (Priority: GIF > PNG)
         picUrl = None
-        main_content = soup.find('main')
-        if main_content:
-            all_imgs = main_content.find_all('img')
-            img_srcs = [img.get('src', '') for img in all_imgs]
-
-            # Extract Title and Tagline 
-            title_el = soup.find('h1')
-            title = title_el.get_text(strip=True) if title_el else query.capitalize()
-                        
-                # Check for GIF first
-            for src in img_srcs:
-                if src.endswith('.gif'):
-                    picUrl = f"https://terminaltrove.com{src}" if src.startswith('/') else src
-                    break
-            
-            # If no GIF, check for PNG
-            if not picUrl:
-                for src in img_srcs:
-                    if src.endswith('.png'):
-                        picUrl = f"https://terminaltrove.com{src}" if src.startswith('/') else src
-                        break
-
-            if picUrl:
-                if picUrl.endswith('.gif'):
-                    log(f"GIF found for <{title}>", "SUCCESS")
-                else:
-                    log(f"PNG found for <{title}>", "SUCCESS")
-            else:
-                log(f"No image found for <{title}>", "WARNING")
-
+        for ext in ('.gif', '.png'):
+            src = next((src for src in parts["images"] if src.endswith(ext)), None)
+            if src is not None:
+                picUrl = absoluteUrl(src)
+                break
 
-        tagline_el = soup.find('p', id='tagline')
-        tagline = tagline_el.get_text(strip=True) if tagline_el else "Terminal tool found on Terminal Trove."
+        if picUrl:
+            if picUrl.endswith('.gif'):
+                log(f"GIF found for <{title}>", "SUCCESS")
+            else:
+                log(f"PNG found for <{title}>", "SUCCESS")
+        else:
+            log(f"No image found for <{title}>", "WARNING")
 
         results.append({
             "title": title,
@@ -261,84 +1910,363 @@ async def scrapeSearch(query: str):
             "gif": picUrl
         })
         
+        scrapeCache.set(cleanQuery, results)
         return results
         
     except Exception as e:
         log(f"Search error: {e}", "ERROR")
-        return []
+        return None
     
 def updateCache(newData):
-    # Load the existing tools from the file if it exists
-    try:
-        with open('tool_cache.json', 'r') as f:
-            oldData = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # If the file doesn't exist, start with an empty list
-        oldData = []
-
-    #  Extract just the titles so we can check for duplicates
-    existingTitles = {tool['title'] for tool in oldData}
-
-    #  Only add tools that we haven't seen before
-    addedCount = 0
-    for tool in newData:
-        if tool['title'] not in existingTitles:
-            oldData.append(tool)
-            addedCount += 1
-
-    #  Save the combined list back to the file
-    with open('tool_cache.json', 'w') as f:
-        json.dump(oldData, f, indent=4)
-    
-    if addedCount == 0:
-        log(f"Cache Up to date. Total: {len(oldData)} tools ")
+    """Merge tools into the shared catalog. Disk writes happen in the background"""
+    with span("cache"), metrics.timer("update_cache_seconds"):
+        added = toolCatalog.add(newData)
+        for tool in added:
+            searchIndex.add(tool)
+            prefixIndex.add(tool['title'])
+    metrics.inc("catalog_tools_added_total", len(added))
+
+    if not added:
+        log(f"Cache Up to date. Total: {len(toolCatalog)} tools ")
     else:
-        log(f"Cache Updated: Added {addedCount} new tools. Total: {len(oldData)}", "SUCCESS")
+        log(f"Cache Updated: Added {len(added)} new tools. Total: {len(toolCatalog)}", "SUCCESS")
+    return added
+
+
+
+# ---------------- Random Sampler ---------------- #
+SAMPLER_MAX_BAGS = int(os.getenv("SAMPLER_MAX_BAGS", 1000))  # Guilds remembered before the least recent is dropped
+
+class ShuffleBag:
+    """Catalog positions not drawn yet. Draws are O(1) and newly cached tools join the bag as they appear"""
+    def __init__(self):
+        self.remaining: list[int] = []
+        self.size = 0       # Catalog size already added to the bag
+        self.last = None
+
+    def draw(self, size: int) -> int:
+        self.remaining.extend(range(self.size, size))
+        self.size = size
+        refilled = not self.remaining
+        if refilled:
+            self.remaining = list(range(size))
+
+        # Swap a random position to the end and pop it
+        index = random.randrange(len(self.remaining))
+        if refilled and self.remaining[index] == self.last and len(self.remaining) > 1:
+            # Bag starts over: don't repeat the tool just shown, but keep it in this cycle
+            index = (index + random.randrange(1, len(self.remaining))) % len(self.remaining)
+        self.remaining[index], self.remaining[-1] = self.remaining[-1], self.remaining[index]
+        self.last = self.remaining.pop()
+        return self.last
+
+class RandomSampler:
+    """One shuffle bag per guild so /randomtool doesn't repeat until every tool was shown"""
+    def __init__(self, maxBags: int = SAMPLER_MAX_BAGS):
+        self.maxBags = maxBags
+        self.bags: OrderedDict[int, ShuffleBag] = OrderedDict()
+
+    def pick(self, key: int) -> dict:
+        bag = self.bags.get(key)
+        if bag is None:
+            bag = self.bags[key] = ShuffleBag()
+            if len(self.bags) > self.maxBags:
+                self.bags.popitem(last=False)
+        self.bags.move_to_end(key)
+        return toolCatalog.at(bag.draw(len(toolCatalog)))
+
+randomSampler = RandomSampler()
+
+
+# ---------------- Media Enrichment ---------------- #
+ENRICH_INTERVAL = float(os.getenv("ENRICH_INTERVAL", 30))          # Minutes between catalog scans
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", 2))       # Pages scraped at once
+ENRICH_DELAY = float(os.getenv("ENRICH_DELAY", 2))                 # Seconds between scrapes (politeness)
+ENRICH_RETRY_AFTER = datetime.timedelta(days=int(os.getenv("ENRICH_RETRY_DAYS", 1)))  # Recheck tools that had no image
+
+class RateLimiter:
+    """Spaces calls at least `delay` seconds apart, across every caller"""
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.nextSlot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self.lock:
+            now = clock.monotonic()
+            if self.nextSlot > now:
+                await asyncio.sleep(self.nextSlot - now)
+            self.nextSlot = max(now, self.nextSlot) + self.delay
+
+def needsMedia(tool: dict) -> bool:
+    if tool.get('gif'):
+        return False
+    scraped = tool.get('scraped')
+    return not scraped or datetime.datetime.now() - datetime.datetime.fromisoformat(scraped) > ENRICH_RETRY_AFTER
+
+class MediaEnricher:
+    """Scrapes cached tools that have no image and saves gif/summary back into the catalog"""
+    def __init__(self, concurrency: int = ENRICH_CONCURRENCY, delay: float = ENRICH_DELAY):
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(delay)
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.queued: dict[str, tuple[int, int]] = {}   # title -> (priority, sequence) of its live queue entry
+        self.running: set[str] = set()
+        self.workers: list[asyncio.Task] = []
+        self.sequence = 0
+        self.enriched = 0
+
+    def request(self, tool: dict, priority: int = 1) -> None:
+        """Queue a tool for scraping. Priority 0 (user facing) jumps ahead of catalog scans"""
+        title = tool['title']
+        if title in self.running or (title in self.queued and self.queued[title][0] <= priority):
+            return
+        # A more urgent request re-queues the tool, the older entry is skipped when it comes up
+        self.sequence += 1
+        self.queued[title] = (priority, self.sequence)
+        self.queue.put_nowait((priority, self.sequence, tool))
+
+    async def scanCatalog(self) -> int:
+        before = len(self.queued)
+        for tool in await toolCatalog.snapshot():
+            if needsMedia(tool):
+                self.request(tool)
+        return len(self.queued) - before
+
+    def start(self) -> None:
+        if not self.workers:
+            self.workers = [asyncio.create_task(self.worker()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def worker(self) -> None:
+        while True:
+            priority, sequence, tool = await self.queue.get()
+            title = tool['title']
+            if self.queued.get(title) != (priority, sequence):
+                self.queue.task_done()
+                continue
+            del self.queued[title]
+            self.running.add(title)
+            try:
+                await self.limiter.wait()
+                await self.enrich(tool)
+            except Exception as e:
+                log(f"Enrichment failed for <{title}>: {e}", "ERROR")
+            finally:
+                self.running.discard(title)
+                self.queue.task_done()
+
+    async def enrich(self, tool: dict) -> None:
+        results = await scrapeSearch(toolSlug(tool))
+        if results is None:
+            # Page never loaded, leave it unstamped so the next scan retries it
+            return
+        fields = {"scraped": datetime.datetime.now().isoformat(timespec="seconds")}
+        if results:
+            fields["gif"] = results[0].get('gif')
+            if not tool.get('summary'):
+                fields["summary"] = results[0]['summary']
+
+        toolCatalog.update(tool['title'], fields)
+        indexed = searchIndex.get(tool['title'])
+        if indexed is not None and indexed is not tool:
+            indexed.update(fields)
 
+        if fields.get("gif"):
+            self.enriched += 1
+            log(f"Media saved for <{tool['title']}>", "SUCCESS")
+
+mediaEnricher = MediaEnricher()
 
 
 # ---------------- UI / Embed Creation ---------------- #
+PAGE_CHAR_BUDGET = int(os.getenv("PAGE_CHAR_BUDGET", 3500))   # Description characters per page (Discord allows 4096)
+PAGE_MAX_TOOLS = int(os.getenv("PAGE_MAX_TOOLS", 15))         # Tools per page, however short they are
+SUMMARY_LIMIT = int(os.getenv("SUMMARY_LIMIT", 220))          # Characters of a summary shown in lists
+EMBED_DESCRIPTION_LIMIT = 4096
+PAGE_CACHE_SNAPSHOTS = 8  # Rendered layouts kept in memory
+
+def truncate(text: str | None, limit: int = SUMMARY_LIMIT) -> str:
+    """Shorten text on a word boundary with an ellipsis"""
+    text = (text or "").strip()
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+def packPages(lines: list[str], header: str, budget: int = PAGE_CHAR_BUDGET, maxPerPage: int = PAGE_MAX_TOOLS) -> list[tuple[int, int]]:
+    """Greedy page boundaries: as many lines as fit in the budget. A line that is too long gets a page to itself"""
+    bounds = []
+    start = 0
+    size = len(header)
+    for index, line in enumerate(lines):
+        added = len(line) + 2  # "\n\n" separator
+        if index > start and (size + added > budget or index - start >= maxPerPage):
+            bounds.append((start, index))
+            start = index
+            size = len(header)
+        size += added
+    bounds.append((start, len(lines)))
+    return bounds
+
+def renderPages(data, title, description, color, budget=PAGE_CHAR_BUDGET, maxPerPage=PAGE_MAX_TOOLS) -> list[discord.Embed]:
+    """Build every page of a paged tool list up front, packed to the character budget"""
+    # Format the dictionaries into a readable string
+    lines = []
+    for count, tool in enumerate(data, start=1):
+        line = f"{count} > **[{tool['title']}]({tool['link']})** \n└ {truncate(tool['summary'])}"
+        lines.append(line)
+
+    pages = []
+    for start, end in packPages(lines, description, budget, maxPerPage):
+        chunkDesc = "\n\n".join(lines[start:end])
+        fullDescription = f"{description}\n\n{chunkDesc}"
+
+        pages.append(discord.Embed(
+            title=f"{title}: Page {len(pages) + 1}",
+            description=fullDescription[:EMBED_DESCRIPTION_LIMIT],
+            color=color 
+        ))
+    return pages
+
+class PageCache:
+    """Rendered pages per data snapshot, shared by every paginator showing it"""
+    def __init__(self, maxEntries: int = PAGE_CACHE_SNAPSHOTS):
+        self.maxEntries = maxEntries
+        self.entries: OrderedDict[tuple, list[discord.Embed]] = OrderedDict()
+
+    def peek(self, snapshot: str, title, description, color) -> list[discord.Embed] | None:
+        key = (snapshot, title, description, color)
+        pages = self.entries.get(key)
+        if pages is not None:
+            self.entries.move_to_end(key)
+        return pages
+
+    def get(self, snapshot: str, data, title, description, color) -> list[discord.Embed]:
+        key = (snapshot, title, description, color)
+        pages = self.entries.get(key)
+        if pages is None:
+            pages = self.entries[key] = renderPages(data, title, description, color)
+            if len(self.entries) > self.maxEntries:
+                self.entries.popitem(last=False)
+        self.entries.move_to_end(key)
+        return pages
+
+pageCache = PageCache()
+
+
+# ---------------- Persistent Pagination ---------------- #
+PERSISTENT_PAGES = os.getenv("PERSISTENT_PAGES", "true").lower() in ("1", "true", "yes")
+PAGE_LAYOUTS = {
+    "tools": {"title": "Terminal Trove Tools", "description": "", "color": 0xff7ec1},
+}
+PAGE_BUTTONS = (
+    ("first", "«", discord.ButtonStyle.gray),
+    ("prev", "Previous", discord.ButtonStyle.gray),
+    ("next", "Next Page", discord.ButtonStyle.green),
+    ("last", "»", discord.ButtonStyle.green),
+)
+
+class PageButton(discord.ui.DynamicItem[discord.ui.Button], template=r"trove:page:(?P<layout>\w+):(?P<snapshot>[0-9a-f]+):(?P<page>\d+):(?P<slot>\w+)"):
+    """Pagination button whose whole state (layout, snapshot, page) lives in its custom_id"""
+    def __init__(self, layout: str, snapshot: str, page: int, slot: str):
+        label, style = next((label, style) for name, label, style in PAGE_BUTTONS if name == slot)
+        super().__init__(discord.ui.Button(label=label, style=style, custom_id=f"trove:page:{layout}:{snapshot}:{page}:{slot}"))
+        self.layout = layout
+        self.snapshot = snapshot
+        self.page = page
+        self.slot = slot
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["layout"], match["snapshot"], int(match["page"]), match["slot"])
+
+    async def callback(self, interaction: discord.Interaction):
+        pages, snapshot = pageCache.peek(self.snapshot, **PAGE_LAYOUTS[self.layout]), self.snapshot
+        deferred = pages is None
+        if deferred:
+            # Rebuilding from the feed can outlast Discord's 3 second window, acknowledge the click first
+            await interaction.response.defer()
+            pages, snapshot = await rebuildPages(self.layout)
+
+        async def reply(message: str):
+            if deferred:
+                return await followup(interaction, message, ephemeral=True)
+            return await interaction.response.send_message(message, ephemeral=True)
+
+        if pages is None:
+            return await reply("Could not load this list, try running the command again.")
+
+        last = len(pages) - 1
+        current = min(self.page, last)
+        target = {"first": 0, "prev": current - 1, "next": current + 1, "last": last}[self.slot]
+        if target < 0 or (self.slot == "first" and current == 0):
+            return await reply("You're on the first page!")
+        if target > last or (self.slot == "last" and current == last):
+            return await reply("You're on the last page!")
+
+        if deferred:
+            await interaction.edit_original_response(embed=pages[target], view=pagerView(self.layout, snapshot, target))
+        else:
+            await interaction.response.edit_message(embed=pages[target], view=pagerView(self.layout, snapshot, target))
+        log(f"{interaction.user.name.capitalize()} turned to page {target + 1}", "INFO", sample="pageTurn", user=interaction.user.id, page=target + 1)
+
+def pagerView(layout: str, snapshot: str, page: int) -> discord.ui.View:
+    """Throwaway view of PageButtons. It is never stored, the registered DynamicItem handles clicks"""
+    view = discord.ui.View(timeout=None)
+    for slot, _, _ in PAGE_BUTTONS:
+        view.add_item(PageButton(layout, snapshot, page, slot))
+    return view
+
+async def rebuildPages(layout: str) -> tuple[list[discord.Embed] | None, str | None]:
+    """Snapshot evicted or bot restarted: continue on the current feed"""
+    tools = await getNewTools()
+    if not tools:
+        return None, None
+    current = feedSnapshot(tools)
+    return pageCache.get(current, tools, **PAGE_LAYOUTS[layout]), current
+
 class CreateEmbed(discord.ui.View):
-    def __init__(self, data, timeout=180, title="New Tool Board", description="", color=0xffffff):
+    def __init__(self, data, timeout=180, title="New Tool Board", description="", color=0xffffff, snapshot=None):
         super().__init__(timeout=timeout)
         self.data = data
         self.titleText = title
         self.descText = description  
         self.color = color
         self.currentPage = 0
-        self.perPage = 8 
-        self.end = (len(data) - 1) // self.perPage
+        self.pages = None
+        if snapshot is not None:
+            # Shared pages replace the view's own copy of the list
+            self.pages = pageCache.get(snapshot, data, title, description, color)
+            self.data = None
 
-    # Paged Embed
-    def createEmbed(self):
-        start = self.currentPage * self.perPage
-        end = start + self.perPage
-        chunk = self.data[start:end]
+    @property
+    def end(self) -> int:
+        return len(self.getPages()) - 1
 
-        # Format the dictionaries into a readable string
-        lines = []
-        count = start + 1
-        for tool in chunk:
+    def getPages(self) -> list[discord.Embed]:
+        if self.pages is None:
+            self.pages = renderPages(self.data, self.titleText, self.descText, self.color)
+        return self.pages
 
-            line = f"{count} > **[{tool['title']}]({tool['link']})** \n└ {tool['summary']}"
-            lines.append(line)
-            count += 1
-
-        chunkDesc = "\n\n".join(lines)
-        fullDescription = f"{self.descText}\n\n{chunkDesc}"
-
-        embed = discord.Embed(
-            title=f"{self.titleText}: Page {self.currentPage + 1}",
-            description=fullDescription,
-            color=self.color 
-        )
-        return embed
+    # Paged Embed
+    def createEmbed(self):
+        return self.getPages()[self.currentPage]
         
-    def newTools(self):
+    def newTools(self, limit=6):
         lines = []
-        for tool in self.data[:6]:
-            line = f"🔹 **[{tool['title']}]({tool['link']})**\n└ *{tool['summary']}*"
+        for tool in self.data[:limit]:
+            line = f"🔹 **[{tool['title']}]({tool['link']})**\n└ *{truncate(tool['summary'])}*"
             lines.append(line)
+        if len(self.data) > limit:
+            lines.append(f"*...and {len(self.data) - limit} more*")
 
         fullDescription = f"{self.descText}\n\n" + "\n\n".join(lines)
 
@@ -398,7 +2326,7 @@ class CreateEmbed(discord.ui.View):
         if self.currentPage > 0:
             self.currentPage = 0
             await interaction.response.edit_message(embed=self.createEmbed(), view=self)
-            log(f"{interaction.user.name.capitalize()} turned to page first page", "INFO")
+            log(f"{interaction.user.name.capitalize()} turned to page first page", "INFO", sample="pageTurn", user=interaction.user.id, page=1)
         else:
             await interaction.response.send_message("You're on the first page!", ephemeral=True)
     
@@ -407,7 +2335,7 @@ class CreateEmbed(discord.ui.View):
         if self.currentPage > 0:
             self.currentPage -= 1
             await interaction.response.edit_message(embed=self.createEmbed(), view=self)
-            log(f"{interaction.user.name.capitalize()} turned to page {self.currentPage + 1}", "INFO")
+            log(f"{interaction.user.name.capitalize()} turned to page {self.currentPage + 1}", "INFO", sample="pageTurn", user=interaction.user.id, page=self.currentPage + 1)
         else:
             await interaction.response.send_message("You're on the first page!", ephemeral=True)
 
@@ -416,7 +2344,7 @@ class CreateEmbed(discord.ui.View):
         if self.currentPage < self.end:
             self.currentPage += 1
             await interaction.response.edit_message(embed=self.createEmbed(), view=self)
-            log(f"{interaction.user.name.capitalize()} turned to page {self.currentPage + 1}", "INFO")
+            log(f"{interaction.user.name.capitalize()} turned to page {self.currentPage + 1}", "INFO", sample="pageTurn", user=interaction.user.id, page=self.currentPage + 1)
         else:
             await interaction.response.send_message("You're on the last page!", ephemeral=True)
 
@@ -425,204 +2353,388 @@ class CreateEmbed(discord.ui.View):
         if self.currentPage < self.end:
             self.currentPage = self.end
             await interaction.response.edit_message(embed=self.createEmbed(), view=self)
-            log(f"{interaction.user.name.capitalize()} turned to last page {self.currentPage + 1}", "INFO")
+            log(f"{interaction.user.name.capitalize()} turned to last page {self.currentPage + 1}", "INFO", sample="pageTurn", user=interaction.user.id, page=self.currentPage + 1)
         else:
             await interaction.response.send_message("You're on the last page!", ephemeral=True)
 
 # ---------------- Commands ---------------- #
+def commandLatency(started: float) -> float:
+    """Milliseconds since a command started, for log fields"""
+    return round((clock.perf_counter() - started) * 1000, 1)
+
+def instrumented(name: str):
+    """Count, time and trace a slash command from invocation to return. Goes under @tree.command"""
+    def decorate(callback):
+        @functools.wraps(callback)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            started = clock.perf_counter()
+            outcome = "error"
+            try:
+                with tracer.trace(name):
+                    result = await callback(interaction, *args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                metrics.inc("commands_total", command=name, outcome=outcome)
+                metrics.observe("command_seconds", clock.perf_counter() - started, command=name)
+        return wrapper
+    return decorate
+
 @tree.command(name="tools", description="Shows all tools posted on 'terminaltrove.com'")
+@instrumented("tools")
 async def tools(interaction: discord.Interaction):
-    await interaction.response.defer()
+    started = clock.perf_counter()
+    with span("defer"):
+        await interaction.response.defer()
 
     log(f"'tools' Called by {interaction.user.name.capitalize()}", "NEW TOOL")
     # Get data   
     tools = await getNewTools()
     if not tools:
         log("'tools' not loaded", "ERROR")
-        return await interaction.followup.send("Could not fetch tools at this time...")
+        return await followup(interaction, "Could not fetch tools at this time...")
     updateCache(tools)
     
     # Create and send embed
-    view = CreateEmbed(data=tools, title="Terminal Trove Tools", color=0xff7ec1)
-    embed = view.createEmbed()
-    log(f"'tools' Posted by {interaction.user.name.capitalize()}","NEW TOOL")
-    await interaction.followup.send(embed=embed, view=view)
+    with span("embed"):
+        snapshot = feedSnapshot(tools)
+        if PERSISTENT_PAGES:
+            embed = pageCache.get(snapshot, tools, **PAGE_LAYOUTS["tools"])[0]
+            view = pagerView("tools", snapshot, 0)
+        else:
+            view = CreateEmbed(data=tools, snapshot=snapshot, **PAGE_LAYOUTS["tools"])
+            embed = view.createEmbed()
+    log(f"'tools' Posted by {interaction.user.name.capitalize()}","NEW TOOL", command="tools", user=interaction.user.id, latency=commandLatency(started))
+    await followup(interaction, embed=embed, view=view)
 
 @tree.command(name="newtools", description="Shows the newest tools on 'terminaltrove.com'")
+@instrumented("newtools")
 async def newTools(interaction: discord.Interaction):
-    await interaction.response.defer()
+    started = clock.perf_counter()
+    with span("defer"):
+        await interaction.response.defer()
     log(f"'newTools' called by {interaction.user.name.capitalize()}", "NEW TOOL")
     
     tools = await getNewTools()
     if not tools:
-        return await interaction.followup.send("Could not fetch live feed. Try again later...")
+        return await followup(interaction, "Could not fetch live feed. Try again later...")
     
     updateCache(tools)
 
-    view = CreateEmbed(
-        data = tools[:6],
-        title = "Newst Terminal Trove Tools",
-        description = "The latest additions to the Terminal Trove directory:",
-        color=0x2f82e4
-    )
+    with span("embed"):
+        view = CreateEmbed(
+            data = tools[:6],
+            title = "Newst Terminal Trove Tools",
+            description = "The latest additions to the Terminal Trove directory:",
+            color=0x2f82e4
+        )
+        embed = view.newTools()
 
-    log(f"'tools' Posted by {interaction.user.name.capitalize()}")
-    await interaction.followup.send(embed=view.newTools())
+    log(f"'newTools' Posted by {interaction.user.name.capitalize()}", "NEW TOOL", command="newtools", user=interaction.user.id, latency=commandLatency(started))
+    await followup(interaction, embed=embed)
 
 
 @tree.command(name="totw", description="Shows the newest 'Tool Of The Week' (Updates every wednesday)")
+@instrumented("totw")
 async def totw(interaction: discord.Interaction):
-    await interaction.response.defer() 
+    started = clock.perf_counter()
+    cacheHit = bool(totwCache["tools"]) and datetime.datetime.now(EASTERN) < totwCache["expires"]
+    with span("defer"):
+        await interaction.response.defer() 
 
     log(f"'toolOfTheWeek' Called by {interaction.user.name.capitalize()}", "TOTW")
     tools = await getToolOfTheWeek()
     if not tools:
         log(f"Unable to post 'toolOfTheWeek' Embed", "TOTW")
-        return await interaction.followup.send("Could not fetch tools.")
-    view = CreateEmbed(data=tools) 
+        return await followup(interaction, "Could not fetch tools.")
+    with span("embed"):
+        embed = CreateEmbed(data=tools).totwEmbed(0)
     
-    log(f"'toolOfTheWeek' Posted by {interaction.user.name.capitalize()} ","TOTW")
-    await interaction.followup.send(embed=view.totwEmbed(0))    
+    log(f"'toolOfTheWeek' Posted by {interaction.user.name.capitalize()} ","TOTW", command="totw", user=interaction.user.id, latency=commandLatency(started), cacheHit=cacheHit)
+    await followup(interaction, embed=embed)    
     
 @tree.command(name="searchtool", description="Find a specific tool by its exact name")
-@discord.app_commands.describe(query="The exact name of the tool (e.g., act3)")
+@discord.app_commands.describe(query="The name of the tool (e.g., act3). Start typing for suggestions")
+@instrumented("searchtool")
 async def searchTool(interaction: discord.Interaction, query: str):
-    await interaction.response.defer()
+    started = clock.perf_counter()
+    with span("defer"):
+        await interaction.response.defer()
     log(f"'searchTool' Called by {interaction.user.name.capitalize()} | Query: <{query}>", "SEARCH")
-    results = await scrapeSearch(query)
+
+    # Answer from the local index first, only scrape slugs we know exist
+    cached = searchIndex.get(query)
+    matches = [] if cached else searchIndex.search(query)
+    if matches and matches[0][0] == 1.0:
+        # Same name once separators are ignored ("tool 5" vs "tool5")
+        cached = matches[0][1]
+
+    cacheHit = bool(cached and cached.get('gif'))
+    metrics.inc("catalog_lookups_total", result="hit" if cached else "miss")
+    if cacheHit:
+        results = [cached]
+    elif cached:
+        results = await scrapeSearch(toolSlug(cached)) or [cached]
+    else:
+        suggestions = [tool['title'] for score, tool in matches if score >= FUZZY_SUGGEST_SCORE]
+        if suggestions:
+            log(f"No exact match for '{query}', suggested {len(suggestions)} tools", "SEARCH")
+            return await followup(interaction, 
+                f"**{query}** was not found. Did you mean: {', '.join(f'`{title}`' for title in suggestions)}?",
+                ephemeral=True
+            )
+        # Last resort: guess the slug
+        results = await scrapeSearch(query)
     
     if not results:
         log(f"Search failed for '{query}'", "SEARCH")
-        return await interaction.followup.send(
+        return await followup(interaction, 
             f"**{query}** was not found. Check the spelling or try /newtools to refresh the cache!", 
             ephemeral=True
         )
 
-    view = CreateEmbed(data=results)
+    with span("embed"):
+        embed = CreateEmbed(data=results).searchEmbed(0)
 
-    log(f"'searchTool' posted by {interaction.user.name.capitalize()}","SEARCH")
-    await interaction.followup.send(embed=view.searchEmbed(0))
+    log(f"'searchTool' posted by {interaction.user.name.capitalize()}","SEARCH", command="searchtool", user=interaction.user.id, latency=commandLatency(started), cacheHit=cacheHit)
+    await followup(interaction, embed=embed)
     
     updateCache(results)
 
+@searchTool.autocomplete("query")
+async def searchToolAutocomplete(interaction: discord.Interaction, current: str) -> list[discord.app_commands.Choice[str]]:
+    """Served from memory only: Discord drops autocomplete answers after ~3s"""
+    titles = prefixIndex.complete(current)
+    if not titles and current:
+        titles = [tool['title'] for score, tool in searchIndex.search(current, limit=10)]
+    return [discord.app_commands.Choice(name=title[:100], value=title[:100]) for title in titles]
+
 @tree.command(name="randomtool", description="Find a random terminal tool from Terminaltrove.com")
+@instrumented("randomtool")
 async def randomTool(interaction: discord.Interaction):
-    try:
-        with open('tool_cache.json', 'r') as f:
-            tools = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+    started = clock.perf_counter()
+    if not len(toolCatalog):
         log("Unable to post 'randomTool")
         return await interaction.response.send_message("Cache is empty! Run /newtools.", ephemeral=True)
     
-    toolChoice = random.choice(tools)
+    toolChoice = dict(randomSampler.pick(interaction.guild_id or interaction.user.id))
     log(f"'randomTool' ran by {interaction.user.name.capitalize()} | TOOL: '{toolChoice["title"]}'", "RANDOM TOOL")
 
-    if 'gif' not in toolChoice or not toolChoice['gif']:
-        await interaction.response.defer() 
-        
-        scrapedData = await scrapeSearch(toolChoice['title'])
-        if scrapedData:
-            toolChoice['gif'] = scrapedData[0].get('gif')
+    # Always answer from the catalog, missing media is filled in the background
+    with span("embed"):
+        embed = CreateEmbed(data=[toolChoice]).randomEmbed(0)
+    with span("send"):
+        await interaction.response.send_message(embed=embed)
 
-        view = CreateEmbed(data=[toolChoice])
-        await interaction.followup.send(embed=view.randomEmbed(0))
-        log(f"'randomTool' posted by {interaction.user.name.capitalize()}", "RANDOM TOOL")
-    
+    if not toolChoice.get('gif'):
+        mediaEnricher.request(toolChoice, priority=0)
+        log(f"'randomTool' posted without GIF, queued <{toolChoice['title']}> for enrichment", "RANDOM TOOL", command="randomtool", user=interaction.user.id, latency=commandLatency(started), cacheHit=False)
     else:
-        view = CreateEmbed(data=[toolChoice])
-        await interaction.response.send_message(embed=view.randomEmbed(0))
-        log("Posted without GIF","RANDOM TOOL")
+        log(f"'randomTool' posted by {interaction.user.name.capitalize()}", "RANDOM TOOL", command="randomtool", user=interaction.user.id, latency=commandLatency(started), cacheHit=True)
+
+async def canConfigure(interaction: discord.Interaction) -> bool:
+    """Bot owner or anyone who can manage the guild. Sends the refusal itself"""
+    if interaction.guild_id is None:
+        await interaction.response.send_message("This command can only be used in a server.", ephemeral=True)
+        return False
+    if OWNER_ID is not None and interaction.user.id == int(OWNER_ID):
+        return True
+    if interaction.user.guild_permissions.manage_guild:
+        return True
+    await interaction.response.send_message("You do not have permission to change this server's settings.", ephemeral=True)
+    return False
 
 @tree.command(name="setchannel", description="Set the channel where all embeds will be sent")
 async def set_channel(interaction: discord.Interaction) -> None:
-    global CHANNEL_ID
-    
-    if OWNER_ID is None:
-        log("Permission check failed: OWNER_ID is not set in .env or config.", "ERROR")
-        return await interaction.response.send_message("Bot configuration error: Owner ID not found.", ephemeral=True)
-
-    if interaction.user.id != int(OWNER_ID):
-        return await interaction.response.send_message("You do not have permission to set channels.", ephemeral=True)
+    if not await canConfigure(interaction):
+        return
 
-    CHANNEL_ID = interaction.channel.id
+    guildConfig(interaction.guild_id)["channel_id"] = interaction.channel.id
     saveConfig()
 
     await interaction.response.send_message(f"Weekly events will now be sent in {interaction.channel.mention}")
-    log(f"Weekly event channel set to {interaction.channel.id} by {interaction.user.name.capitalize()}", "INFO")
+    log(f"Weekly event channel for guild {interaction.guild_id} set to {interaction.channel.id} by {interaction.user.name.capitalize()}", "INFO")
 
 @tree.command(name="setrole", description="Set the role to be pinged during updates")
 @discord.app_commands.describe(role="The role to ping")
 async def setRole(interaction: discord.Interaction, role: discord.Role):
-    global PING_ROLE_ID
-
-    if interaction.user.id != int(OWNER_ID):
-        return await interaction.response.send_message("You do not have permission to set the role..")
+    if not await canConfigure(interaction):
+        return
     
-    PING_ROLE_ID = role.id
+    guildConfig(interaction.guild_id)["ping_role_id"] = role.id
     saveConfig()
 
     await interaction.response.send_message(f"Updates will now be sent in {role.mention}")
-    log(f"Ping role set to {role.id} by {interaction.user.name}", "INFO")
+    log(f"Ping role for guild {interaction.guild_id} set to {role.id} by {interaction.user.name}", "INFO")
+
+@tree.command(name="stats", description="Latency percentiles per command and stage (bot owner only)")
+async def stats(interaction: discord.Interaction):
+    if OWNER_ID is None or interaction.user.id != int(OWNER_ID):
+        return await interaction.response.send_message("Only the bot owner can view stats.", ephemeral=True)
+    if not tracer.enabled:
+        return await interaction.response.send_message("Tracing is turned off (`TRACING=false`).", ephemeral=True)
+
+    summary = tracer.summary()
+    if not summary:
+        return await interaction.response.send_message("No commands traced yet.", ephemeral=True)
+
+    def milliseconds(times: tuple) -> str:
+        return " / ".join(f"{seconds * 1000:.1f}" for seconds in times)
+
+    embed = discord.Embed(
+        title="Command Latency",
+        description=f"p50 / p95 / p99 in ms over the last {len(tracer.traces)} commands",
+        color=0x2f82e4
+    )
+    for command, entry in summary.items():
+        rows = [f"**total** {milliseconds(entry['total'])}"]
+        rows += [f"{stage} {milliseconds(times)}" for stage, times in entry['stages'].items()]
+        embed.add_field(name=f"/{command} ({entry['count']} runs)", value="\n".join(rows), inline=False)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 # ---------------- Background Tasks ---------------- #
-@tasks.loop(minutes=60)
+ANNOUNCE_MAX_TOOLS = 10          # Tools listed in one announcement, the rest are summed up
+ANNOUNCE_CONCURRENCY = int(os.getenv("ANNOUNCE_CONCURRENCY", 5))  # Guilds sent to at once
+
+def announcementTargets() -> list[tuple[int, dict]]:
+    return [(guildId, config) for guildId, config in guild_configs.items() if config.get("channel_id")]
+
+async def announce(embed: discord.Embed, pingText: str | None = None) -> int:
+    """Send one prebuilt embed to every configured guild, a bounded number at a time. Returns guilds reached"""
+    semaphore = asyncio.Semaphore(ANNOUNCE_CONCURRENCY)
+
+    async def sendTo(guildId: int, config: dict) -> bool:
+        async with semaphore:
+            try:
+                channelId = int(config["channel_id"])
+                channel = await sendQueue.getChannel(channelId)
+                # Format the Role Ping
+                roleId = config.get("ping_role_id")
+                content = f"<@&{roleId}> {pingText}" if pingText and roleId else None
+                await sendQueue.send(f"channel:{channelId}", lambda: channel.send(content=content, embed=embed))
+                return True
+            except Exception as e:
+                log(f"Announcement to guild {guildId} failed: {e}", "ERROR")
+                return False
+
+    results = await asyncio.gather(*(sendTo(guildId, config) for guildId, config in announcementTargets()))
+    return sum(results)
+
+@tasks.loop(minutes=POLL_INTERVAL)
 async def websiteUpdate():
-    global LAST_POSTED_TITLE
-
-    if not CHANNEL_ID:
-        log("Website update skipped: No CHANNEL_ID set.", "WARNING")
+    if not announcementTargets():
+        log("Website update skipped: No channel set in any guild.", "WARNING")
         return
     
+    started = clock.perf_counter()
+    outcome = "error"
     try:
-        tools = await getNewTools()
-        if not tools: 
+        # Feed is diffed against every tool already announced, parsing stops once it reaches known ground
+        if seenTools.seeded:
+            tools = await getNewToolsSince(lambda tool: tool in seenTools, SEEN_STOP_RUN)
+        else:
+            tools = await seedSeenTools()
+        if tools is None: 
+            pollScheduler.failed()
             return
-        
-        latestTool = tools[0]
-        
-        if latestTool['title'] != LAST_POSTED_TITLE:
-            log(f"New Tool Detected: {latestTool['title']} | Posting Update...", "SUCCESS")
-
-            channel = await bot.fetch_channel(int(CHANNEL_ID))
-            if not channel:
-                log(f"Could not find channel with ID {CHANNEL_ID}", "ERROR")
-                return
+        pollScheduler.succeeded()
 
-            # Format the Role Ping
-            pingMsg = f"<@&{PING_ROLE_ID}> NEW TERMINAL TOOLS JUST DROPPED!" if PING_ROLE_ID else ""
+        # Learn the publish cadence from the whole feed once, then from each new batch
+        if not pollScheduler.published and lastToolCache["content"]:
+            pollScheduler.observe(iterFeedEntries(lastToolCache["content"]))
+        pollScheduler.observe(tools)
+        
+        outcome = "new" if tools else "unchanged"
+        if tools:
+            log(f"{len(tools)} New Tools Detected: {', '.join(tool['title'] for tool in tools)} | Posting Update...", "SUCCESS")
 
-            # Update local cache and send NEW TOOLS embed
+            # Update local cache and build one NEW TOOLS embed with the whole batch for every guild
             updateCache(tools)
             new_tools_view = CreateEmbed(data=tools, title="NEW TERMINAL TOOLS DETECTED")
-            await channel.send(content=pingMsg, embed=new_tools_view.newTools())
-
-            # Fetch and send TOOL OF THE WEEK embed
-            totwData = await getToolOfTheWeek()
-            if totwData:
-                totw_view = CreateEmbed(data=totwData)
-                await channel.send(embed=totw_view.totwEmbed(0))
-            else:
-                log("New tool found, but TOTW scrape returned nothing.", "WARNING")
+            sent = await announce(new_tools_view.newTools(ANNOUNCE_MAX_TOOLS), "NEW TERMINAL TOOLS JUST DROPPED!")
+            log(f"New tools announced to {sent}/{len(announcementTargets())} guilds", "NEW TOOL")
 
-            LAST_POSTED_TITLE = latestTool['title']
-            saveConfig()
+            # Retry next poll if nobody could be reached
+            if sent:
+                seenTools.add(tools)
+                await seenTools.save()
 
         else:
             log("Checked Terminal Trove: No new tools found.", "INFO")
     
     except Exception as e:
+        pollScheduler.failed()
         log(f"Pulse Task Error: {e}", "ERROR")
 
+    finally:
+        metrics.inc("feed_polls_total", outcome=outcome)
+        metrics.observe("feed_poll_seconds", clock.perf_counter() - started)
+        interval = pollScheduler.nextInterval()
+        websiteUpdate.change_interval(minutes=interval)
+        log(f"Next feed check in {interval:.0f} minutes", "INFO")
+
+@tasks.loop(time=[TOTW_POST_TIME] + TOTW_POST_RETRIES)
+async def weeklyTotw():
+    """Post the new Tool of the Week once it rotates on Wednesday, retrying hourly until it has"""
+    now = datetime.datetime.now(EASTERN)
+    if now.weekday() != TOTW_WEEKDAY:
+        return
+    week = lastTotwRotation(now)
+    if totwCache["postedWeek"] == week:
+        return
+
+    if not announcementTargets():
+        log("Weekly TOTW skipped: No channel set in any guild.", "WARNING")
+        return
+
+    try:
+        totwData = await getToolOfTheWeek()
+        if not totwData:
+            log("Weekly TOTW scrape returned nothing, retrying next hour.", "WARNING")
+            return
+        if totwData[0]['title'] == totwCache["previousTitle"]:
+            retry = "retrying next hour" if now.hour < 23 else "giving up for this week"
+            log(f"Weekly TOTW delayed: Site still shows last week's pick <{totwData[0]['title']}>, {retry}", "WARNING")
+            return
+
+        totw_view = CreateEmbed(data=totwData)
+        sent = await announce(totw_view.totwEmbed(0))
+        if sent:
+            totwCache["postedWeek"] = week
+            totwCache["postedTitle"] = totwData[0]['title']
+            saveConfig()
+        log(f"Weekly TOTW Posted to {sent} guilds: {totwData[0]['title']}", "TOTW")
+
+    except Exception as e:
+        log(f"Weekly TOTW Task Error: {e}", "ERROR")
+
+@tasks.loop(minutes=ENRICH_INTERVAL)
+async def enrichMedia():
+    """Queue every cached tool that still has no image"""
+    queued = await mediaEnricher.scanCatalog()
+    if queued:
+        log(f"Queued {queued} tools for media enrichment", "INFO")
+
 # ---------------- Bot Events ---------------- #
 @bot.event
 async def on_ready():
     log(f"Logged in as {bot.user} (ID: {bot.user.id}) ", "SUCCESS")
+    await migrateLegacyConfig()
     
     if not websiteUpdate.is_running():
         websiteUpdate.start()
         log("Website Update Task Started", "INFO")
 
+    mediaEnricher.start()
+    if not enrichMedia.is_running():
+        enrichMedia.start()
+        log("Media Enrichment Task Started", "INFO")
+
+    if not weeklyTotw.is_running():
+        weeklyTotw.start()
+        log(f"Weekly TOTW Task Started ({TOTW_POST_TIME.strftime('%I:%M %p')} ET on Wednesdays, hourly retries until the pick rotates)", "INFO")
+
     # Sync Commands
     try:
         synced = await bot.tree.sync()
@@ -636,6 +2748,10 @@ async def on_ready():
 def main():
     loadConfig()
     log("Config Loaded", "SUCCESS")
+    toolCatalog.load()
+    seenTools.load()
+    buildSearchIndex()
+    parsePool.start()
 
     try:
         bot.run(TOKEN)